@@ -1,5 +1,6 @@
 import pygame
 
+from model.ai import default_opening_book, shutdown_pool
 from view.game_over_screen import GameOverScreen
 from view.home_screen import HomeScreen
 from view.play_screen import PlayScreen
@@ -12,6 +13,7 @@ from view.session_screen import SessionScreen
 class MainController:
     def __init__(self):
         pygame.init()
+        default_opening_book()  # Mapeia o opening book na inicialização
         self._current_screen = "home"
         self._screen = HomeScreen()
         self._running = True
@@ -46,6 +48,8 @@ class MainController:
 
             self._screen.draw()
             self._screen.clock.tick(60)
+        self._close_screen()
+        shutdown_pool()  # Encerra os processos da IA Monte Carlo, se iniciados
         pygame.quit()
 
     def _handle_click(self, event):
@@ -133,7 +137,15 @@ class MainController:
             self._change_screen("game_over")
             return
 
+    def _close_screen(self):
+        """Avisa a tela atual que ela está sendo deixada"""
+        closer = getattr(self._screen, "close", None)
+        if callable(closer):
+            closer()
+
     def _change_screen(self, screen_name):
+        self._close_screen()
+
         # Para música ao sair da tela home, play ou game_over
         if (
             (self._current_screen == "home" and screen_name != "home")
@@ -30,10 +30,12 @@ class PlayController:
         # Inicializa partida
         self._match = Match(self._player, self._computer)
         self._match.start()
+        self._computer.warm_up()  # Prepara a IA sem bloquear a tela
 
         # Estado do jogo
         self._finished = False
         self._winner = None
+        self._computer_move = None  # Future da jogada do computador em cálculo
 
     def process_player_attack(
         self, row: int, col: int
@@ -85,15 +87,61 @@ class PlayController:
         if self._finished:
             return ("already_attacked", False, True, "O jogo já acabou!")
 
-        attack = self._computer.make_attack()
+        # Na thread de trabalho da IA, depois do warm_up iniciado no __init__
+        attack = self._computer.make_attack_async().result()
+        return self._apply_computer_attack(attack)
+
+    def request_computer_attack(self):
+        """Inicia o cálculo da jogada do computador sem bloquear o chamador"""
+        if self._finished or self._computer_move is not None:
+            return
+        self._computer_move = self._computer.make_attack_async()
+
+    def poll_computer_attack(
+        self,
+    ) -> Optional[Tuple[str, bool, bool, Optional[str]]]:
+        """
+        Aplica a jogada do computador se o cálculo já terminou.
+        Inicia o cálculo se ele ainda não foi pedido.
+
+        Returns:
+            Mesma tupla de process_computer_attack, ou None se ainda calculando
+        """
+        self.request_computer_attack()
+        if self._computer_move is None or not self._computer_move.done():
+            return None
+
+        future, self._computer_move = self._computer_move, None
+        if self._finished:
+            return ("already_attacked", False, True, "O jogo já acabou!")
+        return self._apply_computer_attack(future.result())
+
+    def cancel_computer_attack(self):
+        """Descarta a jogada do computador em cálculo, se houver"""
+        if self._computer_move is not None:
+            self._computer_move.cancel()
+            self._computer_move = None
+
+    def close(self):
+        """Cancela jogadas pendentes e libera os recursos da IA"""
+        self.cancel_computer_attack()
+        self._computer.shutdown()
+
+    def _apply_computer_attack(
+        self, attack
+    ) -> Tuple[str, bool, bool, Optional[str]]:
+        """Executa no tabuleiro do jogador a jogada escolhida pelo computador"""
         if not attack:
             return ("water", False, False, "Computador não conseguiu atacar!")
 
         row, col = attack
         result, ship_destroyed, game_over = self._match.process_turn(row, col)
 
-        # Registra resultado para o computador aprender
-        self._computer.record_attack_result((row, col), result, ship_destroyed)
+        # Registra resultado para o computador aprender (o navio afundado é anunciado)
+        sunk = self._player.board.ship_at(row, col) if ship_destroyed else None
+        self._computer.record_attack_result(
+            (row, col), result, ship_destroyed, sunk.size if sunk else None
+        )
 
         # Gera mensagem
         if result == "hit":
@@ -126,20 +174,20 @@ class PlayController:
         Returns:
             Dicionário com estatísticas da partida
         """
-        player_ships = [
-            ship for ship in self._player.board.ships if not ship.is_destroyed()
-        ]
-        computer_ships = [
-            ship for ship in self._computer.board.ships if not ship.is_destroyed()
-        ]
+        player_board = self._player.board
+        computer_board = self._computer.board
 
         return {
             "turn": self._match.turn,
             "current_player": self._match.current_player.name,
-            "player_ships_remaining": len(player_ships),
-            "player_ships_total": len(self._player.board.ships),
-            "computer_ships_remaining": len(computer_ships),
-            "computer_ships_total": len(self._computer.board.ships),
+            "player_ships_remaining": player_board.ships_remaining,
+            "player_ships_total": len(player_board.ships),
+            "computer_ships_remaining": computer_board.ships_remaining,
+            "computer_ships_total": len(computer_board.ships),
+            "player_shots": computer_board.shot_count,
+            "player_hits": computer_board.hit_count,
+            "computer_shots": player_board.shot_count,
+            "computer_hits": player_board.hit_count,
             "finished": self._finished,
             "winner": self._winner.name if self._winner else None,
         }
@@ -149,16 +197,17 @@ class PlayController:
         Verifica se uma posição é válida para ataque.
 
         Args:
-            row: Linha (0-9)
-            col: Coluna (0-9)
+            row: Linha (0 a board.size - 1)
+            col: Coluna (0 a board.size - 1)
 
         Returns:
             True se a posição é válida e ainda não foi atacada
         """
-        if row < 0 or row >= 10 or col < 0 or col >= 10:
+        board = self._computer.board
+        if row < 0 or row >= board.size or col < 0 or col >= board.size:
             return False
 
-        return (row, col) not in self._computer.board.attacks
+        return not board.is_attacked(row, col)
 
     @property
     def player(self) -> CommonPlayer:
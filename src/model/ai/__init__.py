@@ -0,0 +1,37 @@
+"""AI - motores de decisão de tiro para o SystemPlayer"""
+
+from .batch_targeting import BatchTargeting
+from .board_knowledge import BoardKnowledge
+from .heatmap_targeting import HeatmapTargeting
+from .hunt_target_targeting import HuntTargetTargeting, RandomTargeting
+from .monte_carlo_targeting import MonteCarloTargeting, shutdown_pool
+from .opening_book import BookTargeting, OpeningBook, default_opening_book
+from .strategies import (
+    TargetingStrategy,
+    create_strategy,
+    register_strategy,
+    strategy_names,
+)
+from .transposition import CachedTargeting, TranspositionTable, shared_table
+from .untargeted_cells import UntargetedCells
+
+__all__ = [
+    "BatchTargeting",
+    "BoardKnowledge",
+    "BookTargeting",
+    "CachedTargeting",
+    "HeatmapTargeting",
+    "HuntTargetTargeting",
+    "MonteCarloTargeting",
+    "OpeningBook",
+    "RandomTargeting",
+    "TargetingStrategy",
+    "TranspositionTable",
+    "UntargetedCells",
+    "create_strategy",
+    "default_opening_book",
+    "register_strategy",
+    "shared_table",
+    "shutdown_pool",
+    "strategy_names",
+]
@@ -0,0 +1,156 @@
+"""BatchTargeting - escolha de tiros para N partidas com NumPy"""
+
+from model.entities.board import HIT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STRATEGIES = ("random", "hunt_target")
+
+
+class BatchTargeting:
+    """Escolhe um tiro por partida para N partidas em uma chamada vetorizada.
+
+    O conhecimento de cada partida fica em arrays: células atacadas
+    ``(N, size * size)`` e, para "hunt_target", o modo de busca e o último
+    acerto. As estratégias seguem RandomTargeting e HuntTargetTargeting:
+    uma célula não atacada uniforme (argmax de ruído aleatório sobre as
+    células livres) ou, em modo de busca, um vizinho livre do último acerto.
+    Os códigos de resultado são os de BatchBoard.receive_attacks.
+    """
+
+    def __init__(self, n_games, size=10, strategy="hunt_target", seed=None):
+        """
+        Args:
+            n_games: Número de partidas simultâneas
+            size: Lado dos tabuleiros atacados
+            strategy: "random" ou "hunt_target"
+            seed: Semente do gerador NumPy (opcional)
+
+        Raises:
+            RuntimeError: Se o NumPy não estiver instalado
+            ValueError: Se a estratégia for desconhecida
+        """
+        if np is None:
+            raise RuntimeError(
+                "numpy is not installed. Install with `pip install numpy`."
+            )
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estratégia desconhecida: {strategy}")
+
+        self._n_games = n_games
+        self._size = size
+        self._strategy = strategy
+        self._rng = np.random.default_rng(seed)
+        self._attacked = np.zeros((n_games, size * size), dtype=bool)
+        self._search_mode = np.zeros(n_games, dtype=bool)
+        self._last_hit = np.full(n_games, -1, dtype=np.intp)
+
+        # Vizinhos (cima, baixo, esquerda, direita) de cada célula; -1 = fora
+        cells = np.arange(size * size)
+        rows, cols = np.divmod(cells, size)
+        self._neighbours = np.stack(
+            [
+                np.where(rows > 0, cells - size, -1),
+                np.where(rows < size - 1, cells + size, -1),
+                np.where(cols > 0, cells - 1, -1),
+                np.where(cols < size - 1, cells + 1, -1),
+            ],
+            axis=1,
+        )
+
+    # Propriedades de acesso
+    @property
+    def n_games(self) -> int:
+        return self._n_games
+
+    @property
+    def strategy(self) -> str:
+        return self._strategy
+
+    @property
+    def attacked(self):
+        """Array (N, size * size) de células já atacadas."""
+        return self._attacked
+
+    @property
+    def search_mode(self):
+        """Array (N,) das partidas em modo de busca após um acerto."""
+        return self._search_mode
+
+    def next_attacks(self, games=None):
+        """
+        Escolhe o próximo tiro de cada partida.
+
+        Args:
+            games: Índices das partidas (padrão: todas, em ordem)
+
+        Returns:
+            Tupla (rows, cols) de arrays; -1 nas partidas sem células livres
+        """
+        if games is None:
+            games = np.arange(self._n_games)
+        games = np.asarray(games, dtype=np.intp)
+        attacked = self._attacked[games]
+
+        noise = self._rng.random(attacked.shape)
+        noise[attacked] = -1.0
+        cells = noise.argmax(axis=1)
+        cells[noise[np.arange(len(games)), cells] < 0] = -1
+
+        if self._strategy == "hunt_target":
+            searching = np.flatnonzero(self._search_mode[games])
+            if len(searching):
+                local = games[searching]
+                neighbours = self._neighbours[self._last_hit[local]]
+                free = neighbours >= 0
+                free[free] = ~self._attacked[
+                    np.repeat(local, 4).reshape(-1, 4)[free], neighbours[free]
+                ]
+
+                pick = self._rng.random(neighbours.shape)
+                pick[~free] = -1.0
+                choice = pick.argmax(axis=1)
+                found = free.any(axis=1)
+                cells[searching[found]] = neighbours[found, choice[found]]
+                # Sem vizinhos livres: volta ao modo aleatório
+                self._search_mode[local[~found]] = False
+
+        rows = np.where(cells >= 0, cells // self._size, -1)
+        cols = np.where(cells >= 0, cells % self._size, -1)
+        return rows, cols
+
+    def record_attack_results(self, rows, cols, codes, sunk, games=None):
+        """
+        Registra os resultados de um tiro por partida.
+
+        Args:
+            rows: Linhas dos tiros
+            cols: Colunas dos tiros
+            codes: Códigos WATER/HIT/ALREADY_ATTACKED de BatchBoard
+            sunk: Se cada tiro afundou um navio
+            games: Índices das partidas (padrão: todas, em ordem)
+
+        Partidas com tiro -1 (sem células livres em next_attacks) são
+        ignoradas, junto com o código e o afundamento delas.
+        """
+        if games is None:
+            games = np.arange(self._n_games)
+        games = np.asarray(games, dtype=np.intp)
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        valid = (rows >= 0) & (cols >= 0)
+        games = games[valid]
+        cells = rows[valid] * self._size + cols[valid]
+        self._attacked[games, cells] = True
+
+        if self._strategy == "hunt_target":
+            hit = np.asarray(codes)[valid] == HIT
+            sunk = np.asarray(sunk, dtype=bool)[valid] & hit
+            self._last_hit[games[hit]] = cells[hit]
+            self._search_mode[games[hit & ~sunk]] = True
+            # Navio destruído: volta ao modo aleatório
+            self._search_mode[games[sunk]] = False
+            self._last_hit[games[sunk]] = -1
@@ -0,0 +1,157 @@
+"""BoardKnowledge - o que a IA sabe sobre o tabuleiro adversário"""
+
+from collections import Counter
+
+from model.ai.transposition import MISS, OPEN_HIT, SUNK, cell_key, fleet_key
+
+
+class BoardKnowledge:
+    """Conhecimento acumulado pelos tiros em um tabuleiro adversário.
+
+    Guarda em bitmasks (bit ``row * size + col``) as células atacadas, as
+    bloqueadas (erros e navios afundados) e os acertos de navios ainda não
+    afundados, além dos tamanhos dos navios restantes. Quando um navio
+    afunda, suas células são deduzidas dos acertos em linha com o último
+    tiro (ou do tamanho anunciado, quando conhecido).
+
+    Um hash Zobrist do estado (células com erro, acerto aberto ou navio
+    afundado e navios restantes) é atualizado a cada tiro em O(1) por
+    célula alterada.
+    """
+
+    __slots__ = (
+        "_size",
+        "_attacked",
+        "_blocked",
+        "_open_hits",
+        "_remaining",
+        "_hash",
+    )
+
+    def __init__(self, size, ship_sizes):
+        self._size = size
+        self._attacked = 0
+        self._blocked = 0
+        self._open_hits = 0
+        self._remaining = Counter(ship_sizes)
+        self._hash = 0
+        for length, count in self._remaining.items():
+            self._hash ^= fleet_key(length, count)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def attacked_mask(self) -> int:
+        return self._attacked
+
+    @property
+    def blocked_mask(self) -> int:
+        """Células que não podem conter navios restantes (erros e afundados)."""
+        return self._blocked
+
+    @property
+    def open_hits_mask(self) -> int:
+        """Acertos de navios ainda não afundados."""
+        return self._open_hits
+
+    @property
+    def remaining(self) -> tuple:
+        """Tamanhos dos navios restantes, em ordem decrescente."""
+        return tuple(sorted(self._remaining.elements(), reverse=True))
+
+    @property
+    def zobrist(self) -> int:
+        """Hash Zobrist de 64 bits do conhecimento."""
+        return self._hash
+
+    def is_attacked(self, row, col):
+        """Verifica se uma posição já foi atacada"""
+        return bool(self._attacked >> (row * self._size + col) & 1)
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """
+        Registra o resultado de um tiro.
+
+        Returns:
+            Lista com as células do navio afundado (vazia se nada afundou)
+        """
+        row, col = position
+        cell = row * self._size + col
+        bit = 1 << cell
+        if self._attacked & bit:
+            return []
+        self._attacked |= bit
+
+        if result == "water":
+            self._blocked |= bit
+            self._hash ^= cell_key(cell, MISS)
+        elif result == "hit":
+            self._open_hits |= bit
+            self._hash ^= cell_key(cell, OPEN_HIT)
+            if ship_destroyed:
+                cells = self._sunk_cells(row, col, ship_size)
+                length = len(cells)
+                count = self._remaining[length]
+                if count > 0:
+                    self._remaining[length] = count - 1
+                    self._hash ^= fleet_key(length, count)
+                    self._hash ^= fleet_key(length, count - 1)
+                for sunk in cells:
+                    if self._open_hits >> sunk & 1:
+                        self._hash ^= cell_key(sunk, OPEN_HIT) ^ cell_key(sunk, SUNK)
+                    self._open_hits &= ~(1 << sunk)
+                    self._blocked |= 1 << sunk
+                return cells
+        return []
+
+    def _sunk_cells(self, row, col, ship_size):
+        """Deduz as células do navio afundado a partir dos acertos em linha"""
+        size = self._size
+        open_hits = self._open_hits
+
+        def run(d_row, d_col):
+            # Sequência contígua de acertos abertos passando por (row, col)
+            before = 0
+            while True:
+                r, c = row - (before + 1) * d_row, col - (before + 1) * d_col
+                if 0 <= r < size and 0 <= c < size and open_hits >> (r * size + c) & 1:
+                    before += 1
+                else:
+                    break
+            after = 0
+            while True:
+                r, c = row + (after + 1) * d_row, col + (after + 1) * d_col
+                if 0 <= r < size and 0 <= c < size and open_hits >> (r * size + c) & 1:
+                    after += 1
+                else:
+                    break
+            return before, after
+
+        runs = [((0, 1), run(0, 1)), ((1, 0), run(1, 0))]
+        lengths = [b + a + 1 for _, (b, a) in runs]
+
+        if ship_size is None:
+            # Maior tamanho restante que cabe em alguma das sequências
+            fits = [
+                length
+                for length, count in self._remaining.items()
+                if count > 0 and length <= max(lengths)
+            ]
+            ship_size = max(fits) if fits else max(lengths)
+
+        for ((d_row, d_col), (before, after)), length in sorted(
+            zip(runs, lengths), key=lambda item: item[1], reverse=True
+        ):
+            if length < ship_size:
+                continue
+            # Prefere o último tiro em uma das pontas do navio
+            start = -min(before, ship_size - 1)
+            if after >= ship_size - 1 and before < ship_size - 1:
+                start = 0
+            return [
+                (row + (start + i) * d_row) * size + col + (start + i) * d_col
+                for i in range(ship_size)
+            ]
+        return [row * size + col]
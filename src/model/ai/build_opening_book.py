@@ -0,0 +1,45 @@
+"""Builder offline do opening book
+
+Uso (a partir da raiz do projeto):
+    PYTHONPATH=src python -m model.ai.build_opening_book --sizes 8,10 --moves 12
+"""
+
+import argparse
+
+from model.ai.opening_book import (
+    DEFAULT_BOOK_PATH,
+    compute_opening,
+    write_opening_book,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Calcula aberturas por (tamanho, frota) e grava o opening book"
+    )
+    parser.add_argument("--sizes", default="10", help="Tamanhos separados por vírgula")
+    parser.add_argument(
+        "--fleet", default="4,3,3,3,2", help="Tamanhos dos navios separados por vírgula"
+    )
+    parser.add_argument("--moves", type=int, default=12, help="Tiros por abertura")
+    parser.add_argument(
+        "--engine", choices=("monte_carlo", "heatmap"), default="monte_carlo"
+    )
+    parser.add_argument("--deadline-ms", type=float, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_BOOK_PATH)
+    args = parser.parse_args(argv)
+
+    fleet = tuple(sorted((int(length) for length in args.fleet.split(",")), reverse=True))
+    lines = {}
+    for size in (int(size) for size in args.sizes.split(",")):
+        lines[(size, fleet)] = compute_opening(
+            size, fleet, args.moves, args.engine, args.deadline_ms, args.seed
+        )
+        print(f"{size}x{size} {fleet}: {lines[(size, fleet)]}")
+    write_opening_book(args.output, lines)
+    print(f"Opening book gravado em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
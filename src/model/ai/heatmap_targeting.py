@@ -0,0 +1,192 @@
+"""HeatmapTargeting - mira por densidade de probabilidade das posições de navio"""
+
+import random
+from collections import Counter
+
+from model.ai.board_knowledge import BoardKnowledge
+from model.placement import placement_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Peso extra por acerto coberto por uma posição no modo de caça a navio atingido
+_TARGET_HIT_WEIGHT = 8
+
+
+class HeatmapTargeting:
+    """Escolhe o próximo tiro pela densidade de posições legais dos navios restantes.
+
+    As posições de cada tamanho de navio vêm das tabelas compartilhadas de
+    model.placement, enumeradas uma vez por processo. O mapa de calor base
+    conta, por célula, quantas posições ainda legais dos navios restantes a
+    cobrem, e é atualizado de forma incremental: um erro ou um navio
+    afundado invalida só as posições que passam pelas células afetadas.
+    Enquanto houver acertos de navios ainda não afundados, o tiro é
+    escolhido entre as posições que cobrem esses acertos.
+    """
+
+    def __init__(self, size, ship_sizes, rng=None):
+        """
+        Inicializa o mapa de calor para um tabuleiro vazio.
+
+        Args:
+            size: Lado do tabuleiro atacado
+            ship_sizes: Tamanhos dos navios da frota adversária
+            rng: Gerador random.Random para desempates (opcional)
+
+        Raises:
+            RuntimeError: Se o NumPy não estiver instalado
+        """
+        if np is None:
+            raise RuntimeError(
+                "numpy is not installed. Install with `pip install numpy`."
+            )
+
+        self._size = size
+        self._rng = rng or random.Random()
+        self._knowledge = BoardKnowledge(size, ship_sizes)
+        self._remaining = Counter(ship_sizes)  # Frota usada nos pesos da densidade
+
+        n_cells = size * size
+        self._attacked = np.zeros(n_cells, dtype=bool)
+        self._open_hits = np.zeros(n_cells, dtype=bool)  # Acertos de navios não afundados
+        self._blocked = np.zeros(n_cells, dtype=bool)  # Erros e navios afundados
+
+        # Por tamanho: células de cada posição, posições ainda legais,
+        # posições que cobrem cada célula e cobertura por célula
+        self._cells = {}
+        self._valid = {}
+        self._covering = {}
+        self._coverage = {}
+        self._density = np.zeros(n_cells, dtype=np.int64)
+        self._last_scores = None
+        for length in self._remaining:
+            table = placement_table(size, length)
+            cells = table.cells
+            self._cells[length] = cells
+            self._valid[length] = np.ones(len(cells), dtype=bool)
+            self._covering[length] = table.covering
+            coverage = np.bincount(cells.ravel(), minlength=n_cells)
+            self._coverage[length] = coverage
+            self._density += self._remaining[length] * coverage
+
+    @property
+    def knowledge(self) -> BoardKnowledge:
+        """Conhecimento acumulado sobre o tabuleiro adversário."""
+        return self._knowledge
+
+    @property
+    def heatmap(self):
+        """Array (size, size) com o peso de cada célula para o próximo tiro."""
+        return self._scores().reshape(self._size, self._size)
+
+    @property
+    def last_heatmap(self):
+        """Mapa de calor (somente leitura) usado na última decisão, ou None."""
+        if self._last_scores is None:
+            return None
+        return self._last_scores.reshape(self._size, self._size)
+
+    def _block(self, cell):
+        """Invalida as posições que passam por uma célula sem navio disponível"""
+        if self._blocked[cell]:
+            return
+        self._blocked[cell] = True
+        n_cells = self._size * self._size
+        for length, (indptr, placement_ids) in self._covering.items():
+            ids = placement_ids[indptr[cell] : indptr[cell + 1]]
+            valid = self._valid[length]
+            ids = ids[valid[ids]]
+            if not len(ids):
+                continue
+            valid[ids] = False
+            lost = np.bincount(self._cells[length][ids].ravel(), minlength=n_cells)
+            self._coverage[length] -= lost
+            self._density -= self._remaining[length] * lost
+
+    def _scores(self):
+        """Peso de cada célula (0 para células já atacadas)"""
+        if self._open_hits.any():
+            scores = self._target_scores()
+        else:
+            scores = self._density.copy()
+        scores[self._attacked] = 0
+        return scores
+
+    def _target_scores(self):
+        """Pesos das posições legais que cobrem acertos ainda não afundados"""
+        n_cells = self._size * self._size
+        hit_cells = np.flatnonzero(self._open_hits)
+        scores = np.zeros(n_cells, dtype=np.int64)
+        for length, count in self._remaining.items():
+            if count <= 0:
+                continue
+            indptr, placement_ids = self._covering[length]
+            ids = np.unique(
+                np.concatenate(
+                    [placement_ids[indptr[c] : indptr[c + 1]] for c in hit_cells]
+                )
+            )
+            ids = ids[self._valid[length][ids]]
+            if not len(ids):
+                continue
+            cells = self._cells[length][ids]
+            hits = self._open_hits[cells].sum(axis=1)
+            weights = count * _TARGET_HIT_WEIGHT ** hits.astype(np.int64)
+            scores += np.bincount(
+                cells.ravel(), weights=np.repeat(weights, length), minlength=n_cells
+            ).astype(np.int64)
+        return scores
+
+    def next_attack(self, deadline_ms=None):
+        """
+        Retorna a próxima posição (linha, coluna) a atacar, ou None.
+        O cálculo é incremental e não usa o prazo (deadline_ms).
+        """
+        scores = self._scores()
+        scores.flags.writeable = False
+        self._last_scores = scores
+        best = scores.max()
+        if best > 0:
+            candidates = np.flatnonzero(scores == best)
+        else:
+            # Conhecimento inconsistente (ex.: frota diferente): qualquer célula livre
+            candidates = np.flatnonzero(~self._attacked)
+            if not len(candidates):
+                return None
+        cell = int(candidates[self._rng.randrange(len(candidates))])
+        return divmod(cell, self._size)
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """
+        Atualiza o mapa com o resultado de um tiro.
+
+        Args:
+            position: Posição (linha, coluna) atacada
+            result: "water", "hit" ou "already_attacked"
+            ship_destroyed: True se o tiro afundou um navio
+            ship_size: Tamanho do navio afundado, se conhecido
+        """
+        sunk_cells = self._knowledge.record_attack_result(
+            position, result, ship_destroyed, ship_size
+        )
+
+        row, col = position
+        cell = row * self._size + col
+        self._attacked[cell] = True
+
+        if result == "water":
+            self._block(cell)
+        elif result == "hit":
+            self._open_hits[cell] = True
+            if sunk_cells:
+                # Navio saiu da frota: remove sua cobertura da densidade
+                length = len(sunk_cells)
+                if self._remaining[length] > 0:
+                    self._remaining[length] -= 1
+                    self._density -= self._coverage[length]
+                for sunk in sunk_cells:
+                    self._open_hits[sunk] = False
+                    self._block(sunk)
@@ -0,0 +1,84 @@
+"""RandomTargeting e HuntTargetTargeting - motores de mira simples"""
+
+import random
+
+from model.ai.untargeted_cells import UntargetedCells
+
+
+class RandomTargeting:
+    """Atira em uma célula não atacada sorteada uniformemente."""
+
+    def __init__(self, size, rng=None):
+        """
+        Args:
+            size: Lado do tabuleiro atacado
+            rng: Gerador random.Random (padrão: módulo random)
+        """
+        self._size = size
+        self._rng = rng or random
+        self._untargeted = UntargetedCells(size)
+
+    def next_attack(self, deadline_ms=None):
+        """Retorna a próxima posição (linha, coluna) a atacar, ou None"""
+        return self._untargeted.choice(self._rng)
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """Remove a posição atacada das candidatas"""
+        self._untargeted.discard(position)
+
+
+class HuntTargetTargeting(RandomTargeting):
+    """Tiros aleatórios até acertar; então ataca os vizinhos do último acerto."""
+
+    def __init__(self, size, rng=None):
+        super().__init__(size, rng)
+        self._search_mode = False  # Active search mode after hit
+        self._last_hit = None
+
+    def next_attack(self, deadline_ms=None):
+        """Retorna a próxima posição (linha, coluna) a atacar, ou None"""
+        # If in search mode (hit a ship but didn't destroy it)
+        if self._search_mode and self._last_hit:
+            attack = self._smart_attack()
+            if attack:
+                return attack
+            else:
+                # If no more directions, return to random
+                self._search_mode = False
+
+        # Random attack
+        return super().next_attack(deadline_ms)
+
+    def _smart_attack(self):
+        """Ataca posições adjacentes ao último acerto"""
+        row, col = self._last_hit
+
+        # Directions: up, down, left, right
+        directions = [
+            (row - 1, col),
+            (row + 1, col),
+            (row, col - 1),
+            (row, col + 1),
+        ]
+
+        # Filter valid and unattacked positions
+        valid_positions = [
+            position for position in directions if position in self._untargeted
+        ]
+
+        if valid_positions:
+            return self._rng.choice(valid_positions)
+        return None
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """Registra resultado do ataque para melhorar próximos movimentos"""
+        super().record_attack_result(position, result, ship_destroyed, ship_size)
+
+        if result == "hit":
+            self._last_hit = position
+            if not ship_destroyed:
+                self._search_mode = True
+            else:
+                # Ship destroyed, return to random mode
+                self._search_mode = False
+                self._last_hit = None
@@ -0,0 +1,303 @@
+"""MonteCarloTargeting - amostragem de frotas consistentes em um pool de processos"""
+
+import logging
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from model.ai.board_knowledge import BoardKnowledge
+from model.placement import placement_table
+
+# Prazo padrão por jogada (ms)
+DEFAULT_DEADLINE_MS = 50
+
+# Tentativas de sorteio por tarefa; tarefas curtas mantêm o prazo preciso
+CHUNK_ATTEMPTS = 400
+
+# Tentativas entre verificações do prazo na amostragem local
+DEADLINE_CHECK_ATTEMPTS = 16
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_workers = 0
+
+# Cache por processo das posições legais para o último estado amostrado
+_legal_cache = {}
+
+
+def _pool_context():
+    """
+    Contexto dos processos do pool: forkserver, ou spawn onde não existe.
+
+    O pool é criado na thread de jogadas do jogo, que tem outras threads
+    (pygame); um fork desse processo pode travar com locks herdados.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _get_executor(workers):
+    """Pool de processos compartilhado, recriado se o número de workers mudar"""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context())
+        _executor_workers = workers
+    return _executor
+
+
+def shutdown_pool():
+    """Encerra o pool de processos compartilhado"""
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+
+
+def _legal_placements(size, lengths, blocked):
+    """Bitmasks das posições de cada navio que evitam as células bloqueadas"""
+    key = (size, lengths, blocked)
+    legal = _legal_cache.get(key)
+    if legal is None:
+        legal = [
+            [mask for mask in placement_table(size, length).masks if not mask & blocked]
+            for length in lengths
+        ]
+        _legal_cache.clear()
+        _legal_cache[key] = legal
+    return legal
+
+
+def sample_hit_counts(size, lengths, blocked, open_hits, attempts, seed, deadline=None):
+    """
+    Sorteia frotas consistentes com o conhecimento e conta navios por célula.
+
+    Cada tentativa escolhe uma posição legal uniforme para cada navio e é
+    aceita se os navios não se sobrepõem e cobrem todos os acertos abertos.
+    Com ``deadline`` (instante de time.perf_counter, só no próprio processo)
+    para antes das ``attempts`` tentativas quando o prazo acaba.
+
+    Returns:
+        Tupla (contagens, aceitas): dict célula -> número de frotas aceitas
+        com navio na célula (sem contar acertos já conhecidos) e o total de
+        frotas aceitas
+    """
+    rng = random.Random(seed)
+    legal = _legal_placements(size, lengths, blocked)
+    counts = {}
+    accepted = 0
+    if any(not options for options in legal):
+        return counts, accepted
+
+    for attempt in range(attempts):
+        if (
+            deadline is not None
+            and attempt % DEADLINE_CHECK_ATTEMPTS == 0
+            and time.perf_counter() >= deadline
+        ):
+            break
+        occupied = 0
+        for options in legal:
+            mask = options[rng.randrange(len(options))]
+            if mask & occupied:
+                break
+            occupied |= mask
+        else:
+            if occupied & open_hits != open_hits:
+                continue
+            accepted += 1
+            free = occupied & ~open_hits
+            while free:
+                low = free & -free
+                cell = low.bit_length() - 1
+                counts[cell] = counts.get(cell, 0) + 1
+                free ^= low
+    return counts, accepted
+
+
+class MonteCarloTargeting:
+    """Escolhe a célula com navio na maior parte das frotas sorteadas.
+
+    As frotas são sorteadas em paralelo em um ProcessPoolExecutor, em
+    tarefas curtas, até o prazo da jogada. A busca é anytime: quando o prazo
+    acaba, a melhor célula encontrada até então é usada e as tarefas
+    pendentes são descartadas. Com ``workers=0`` as amostras são feitas no
+    próprio processo.
+    """
+
+    def __init__(
+        self, size, ship_sizes, rng=None, deadline_ms=DEFAULT_DEADLINE_MS, workers=None
+    ):
+        """
+        Args:
+            size: Lado do tabuleiro atacado
+            ship_sizes: Tamanhos dos navios da frota adversária
+            rng: Gerador random.Random (opcional)
+            deadline_ms: Prazo padrão por jogada
+            workers: Processos do pool (padrão: núcleos da máquina; 0 = sem pool)
+        """
+        self._size = size
+        self._rng = rng or random.Random()
+        self._deadline_ms = deadline_ms
+        self._workers = (os.cpu_count() or 1) if workers is None else workers
+        self._knowledge = BoardKnowledge(size, ship_sizes)
+        self._last_samples = 0
+        self._last_counts = {}
+
+    @property
+    def knowledge(self) -> BoardKnowledge:
+        """Conhecimento acumulado sobre o tabuleiro adversário."""
+        return self._knowledge
+
+    @property
+    def last_samples(self) -> int:
+        """Frotas consistentes amostradas na última decisão."""
+        return self._last_samples
+
+    @property
+    def last_heatmap(self):
+        """Frotas amostradas com navio em cada célula na última decisão."""
+        size = self._size
+        counts = self._last_counts
+        return tuple(
+            tuple(counts.get(row * size + col, 0) for col in range(size))
+            for row in range(size)
+        )
+
+    def warm_up(self):
+        """Inicia os processos do pool antes da primeira jogada"""
+        if self._workers > 0:
+            executor = _get_executor(self._workers)
+            futures = [
+                executor.submit(sample_hit_counts, 1, (), 0, 0, 0, 0)
+                for _ in range(self._workers)
+            ]
+            wait(futures)
+
+    def next_attack(self, deadline_ms=None):
+        """Retorna a próxima posição (linha, coluna) a atacar, ou None"""
+        budget = self._deadline_ms if deadline_ms is None else deadline_ms
+        deadline = time.perf_counter() + budget / 1000
+        knowledge = self._knowledge
+        state = (
+            self._size,
+            knowledge.remaining,
+            knowledge.blocked_mask,
+            knowledge.open_hits_mask,
+            CHUNK_ATTEMPTS,
+        )
+
+        if self._workers > 0:
+            totals, accepted = self._sample_parallel(state, deadline)
+        else:
+            totals, accepted = self._sample_inline(state, deadline)
+        self._last_samples = accepted
+        self._last_counts = totals
+
+        if totals:
+            best = max(totals.values())
+            candidates = sorted(cell for cell, count in totals.items() if count == best)
+            return divmod(self._rng.choice(candidates), self._size)
+        return self._fallback_attack()
+
+    def _sample_inline(self, state, deadline, totals=None, accepted=0):
+        """Amostra no próprio processo até o prazo, somando a ``totals``"""
+        totals = Counter() if totals is None else totals
+        while time.perf_counter() < deadline:
+            counts, chunk_accepted = sample_hit_counts(
+                *state, self._rng.getrandbits(64), deadline
+            )
+            totals.update(counts)
+            accepted += chunk_accepted
+        return totals, accepted
+
+    def _use_inline_sampling(self, error):
+        """Descarta o pool com problema; as próximas jogadas amostram localmente"""
+        logger.warning("Pool indisponível, amostrando localmente: %s", error)
+        self._workers = 0
+        shutdown_pool()
+
+    def _sample_parallel(self, state, deadline):
+        """Distribui tarefas de amostragem no pool até o prazo"""
+        totals = Counter()
+        accepted = 0
+        try:
+            executor = _get_executor(self._workers)
+            pending = {
+                executor.submit(sample_hit_counts, *state, self._rng.getrandbits(64))
+                for _ in range(self._workers * 2)
+            }
+        except Exception as e:
+            self._use_inline_sampling(e)
+            return self._sample_inline(state, deadline)
+
+        broken = None
+        while pending and broken is None:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    counts, chunk_accepted = future.result()
+                except BrokenProcessPool as e:
+                    broken = e
+                    break
+                except Exception:
+                    continue
+                totals.update(counts)
+                accepted += chunk_accepted
+                if time.perf_counter() < deadline:
+                    try:
+                        pending.add(
+                            executor.submit(
+                                sample_hit_counts, *state, self._rng.getrandbits(64)
+                            )
+                        )
+                    except (BrokenProcessPool, RuntimeError) as e:
+                        broken = e
+                        break
+
+        # Prazo encerrado: o que ainda não começou é cancelado
+        for future in pending:
+            future.cancel()
+        if broken is not None:
+            # Pool quebrou no meio da jogada: o resto do prazo é amostrado aqui
+            self._use_inline_sampling(broken)
+            return self._sample_inline(state, deadline, totals, accepted)
+        return totals, accepted
+
+    def _fallback_attack(self):
+        """Sem amostras a tempo: vizinho de um acerto aberto ou célula livre aleatória"""
+        size = self._size
+        knowledge = self._knowledge
+        open_hits = knowledge.open_hits_mask
+        candidates = []
+        while open_hits:
+            low = open_hits & -open_hits
+            row, col = divmod(low.bit_length() - 1, size)
+            for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if 0 <= r < size and 0 <= c < size and not knowledge.is_attacked(r, c):
+                    candidates.append((r, c))
+            open_hits ^= low
+        if candidates:
+            return self._rng.choice(candidates)
+
+        attacked = knowledge.attacked_mask
+        free = [cell for cell in range(size * size) if not attacked >> cell & 1]
+        if not free:
+            return None
+        return divmod(self._rng.choice(free), size)
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """Atualiza o conhecimento com o resultado de um tiro"""
+        self._knowledge.record_attack_result(position, result, ship_destroyed, ship_size)
@@ -0,0 +1,260 @@
+"""Opening book - primeiros tiros pré-calculados por (tamanho do tabuleiro, frota)
+
+Enquanto todos os tiros foram água, o conhecimento da IA depende só do
+tamanho do tabuleiro e da frota, então a melhor sequência de abertura é a
+mesma em todas as partidas. O builder calcula essa sequência offline com um
+motor forte e grava um arquivo binário compacto; em jogo o arquivo é lido
+via mmap e consultado até o primeiro acerto.
+
+Formato (little-endian):
+    cabeçalho: magic b"SSOB", versão (u8), número de entradas (u16)
+    índice, por entrada: tamanho (u16), frota (8 x u8, decrescente e
+        completada com zeros), offset dos tiros (u32), número de tiros (u16)
+    tiros: células ``row * size + col`` (u16, ou u32 se size * size > 65535)
+
+Uso do builder (a partir da raiz do projeto):
+    PYTHONPATH=src python -m model.ai.build_opening_book --sizes 10 --moves 12
+"""
+
+import mmap
+import random
+import struct
+from pathlib import Path
+
+from model.ai.heatmap_targeting import HeatmapTargeting
+from model.ai.monte_carlo_targeting import MonteCarloTargeting
+
+# data/opening_book.bin na raiz do projeto, independente do diretório atual
+DEFAULT_BOOK_PATH = str(
+    Path(__file__).resolve().parent.parent.parent.parent / "data" / "opening_book.bin"
+)
+
+_MAGIC = b"SSOB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBH")
+_ENTRY = struct.Struct("<H8sIH")
+_MAX_FLEET = 8
+
+# Simetrias do tabuleiro quadrado: (transpõe, espelha linhas, espelha colunas)
+_SYMMETRIES = tuple(
+    (transpose, flip_rows, flip_cols)
+    for transpose in (False, True)
+    for flip_rows in (False, True)
+    for flip_cols in (False, True)
+)
+
+_default_book = None
+_default_book_loaded = False
+
+
+def _fleet_key(ship_sizes):
+    """Frota como tupla decrescente de tamanhos"""
+    return tuple(sorted(ship_sizes, reverse=True))
+
+
+def _cell_format(size):
+    return "H" if size * size <= 0xFFFF else "I"
+
+
+class OpeningBook:
+    """Leitor de um arquivo de aberturas mapeado em memória."""
+
+    def __init__(self, path):
+        """
+        Abre o arquivo e lê o índice; os tiros são lidos sob demanda.
+
+        Raises:
+            ValueError: Se o arquivo não for um opening book válido
+        """
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = self._data
+        if len(data) < _HEADER.size:
+            raise ValueError("Opening book truncado")
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError("Arquivo não é um opening book")
+        if version != _VERSION:
+            raise ValueError(f"Versão de opening book não suportada: {version}")
+
+        self._index = {}
+        offset = _HEADER.size
+        for _ in range(count):
+            if offset + _ENTRY.size > len(data):
+                raise ValueError("Opening book truncado")
+            size, fleet, moves_offset, n_moves = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            fleet = tuple(length for length in fleet if length)
+            fmt = _cell_format(size)
+            if moves_offset + n_moves * struct.calcsize(fmt) > len(data):
+                raise ValueError("Opening book truncado")
+            self._index[(size, fleet)] = (moves_offset, n_moves, fmt)
+
+    def __contains__(self, key):
+        size, ship_sizes = key
+        return (size, _fleet_key(ship_sizes)) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def line(self, size, ship_sizes):
+        """Sequência de tiros (linha, coluna) para o caso de só dar água, ou ()"""
+        entry = self._index.get((size, _fleet_key(ship_sizes)))
+        if entry is None:
+            return ()
+        offset, n_moves, fmt = entry
+        cells = struct.unpack_from(f"<{n_moves}{fmt}", self._data, offset)
+        return tuple(divmod(cell, size) for cell in cells)
+
+    def close(self):
+        """Libera o mapeamento do arquivo"""
+        self._data.close()
+
+
+def load_opening_book(path=DEFAULT_BOOK_PATH):
+    """Abre um opening book, ou retorna None se o arquivo não existir ou for inválido"""
+    try:
+        return OpeningBook(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Aviso: Não foi possível carregar o opening book {path}: {e}")
+        return None
+
+
+def default_opening_book():
+    """
+    Opening book padrão, mapeado uma única vez por processo.
+
+    O SystemPlayer dos níveis fortes e o MainController o carregam na
+    criação, para que a leitura (ou a falha) não caia na primeira jogada.
+    """
+    global _default_book, _default_book_loaded
+    if not _default_book_loaded:
+        _default_book = load_opening_book(DEFAULT_BOOK_PATH)
+        _default_book_loaded = True
+    return _default_book
+
+
+class BookTargeting:
+    """Usa a linha do opening book enquanto todos os tiros forem água.
+
+    Uma simetria do tabuleiro sorteada no início da partida varia a
+    abertura sem mudar sua qualidade. Todos os resultados são repassados ao
+    motor de mira, que assume as jogadas quando a posição sai do livro.
+    """
+
+    def __init__(self, engine, size, line, rng=None):
+        """
+        Args:
+            engine: Motor de mira usado fora do livro
+            size: Lado do tabuleiro atacado
+            line: Sequência de tiros (linha, coluna) do livro
+            rng: Gerador random.Random para a simetria (opcional)
+        """
+        rng = rng or random
+        transpose, flip_rows, flip_cols = rng.choice(_SYMMETRIES)
+        last = size - 1
+        moves = []
+        for row, col in line:
+            if transpose:
+                row, col = col, row
+            if flip_rows:
+                row = last - row
+            if flip_cols:
+                col = last - col
+            moves.append((row, col))
+
+        self._engine = engine
+        self._line = moves
+        self._ply = 0
+        self._in_book = bool(moves)
+
+    @property
+    def engine(self):
+        """Motor de mira usado fora do livro."""
+        return self._engine
+
+    @property
+    def in_book(self) -> bool:
+        """Verifica se a próxima jogada ainda vem do livro."""
+        return self._in_book
+
+    def next_attack(self, deadline_ms=None):
+        """Retorna a próxima posição (linha, coluna) a atacar, ou None"""
+        if self._in_book:
+            return self._line[self._ply]
+        return self._engine.next_attack(deadline_ms)
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """Repassa o resultado ao motor e sai do livro no primeiro desvio"""
+        if self._in_book:
+            if result == "water" and position == self._line[self._ply]:
+                self._ply += 1
+                self._in_book = self._ply < len(self._line)
+            else:
+                self._in_book = False
+        self._engine.record_attack_result(position, result, ship_destroyed, ship_size)
+
+
+def compute_opening(
+    size, ship_sizes, moves, engine="monte_carlo", deadline_ms=2000, seed=0
+):
+    """
+    Calcula a sequência de abertura assumindo que todos os tiros são água.
+
+    Args:
+        size: Lado do tabuleiro
+        ship_sizes: Tamanhos dos navios da frota
+        moves: Número de tiros da linha
+        engine: "monte_carlo" (mais forte) ou "heatmap" (mais rápido)
+        deadline_ms: Prazo por tiro do Monte Carlo
+        seed: Semente dos sorteios e desempates
+
+    Returns:
+        Lista de posições (linha, coluna)
+    """
+    rng = random.Random(seed)
+    if engine == "monte_carlo":
+        targeting = MonteCarloTargeting(size, ship_sizes, rng=rng, workers=0)
+    elif engine == "heatmap":
+        targeting = HeatmapTargeting(size, ship_sizes, rng=rng)
+    else:
+        raise ValueError(f"Motor desconhecido: {engine}")
+
+    line = []
+    for _ in range(min(moves, size * size)):
+        attack = targeting.next_attack(deadline_ms)
+        if attack is None:
+            break
+        line.append(attack)
+        targeting.record_attack_result(attack, "water", False)
+    return line
+
+
+def write_opening_book(path, lines):
+    """
+    Grava um opening book.
+
+    Args:
+        path: Arquivo de saída
+        lines: dict (tamanho, frota) -> sequência de posições (linha, coluna)
+    """
+    entries = []
+    for (size, ship_sizes), line in lines.items():
+        fleet = _fleet_key(ship_sizes)
+        if len(fleet) > _MAX_FLEET or not all(0 < length < 256 for length in fleet):
+            raise ValueError(f"Frota não suportada no opening book: {fleet}")
+        cells = [row * size + col for row, col in line]
+        entries.append((size, fleet, cells))
+
+    offset = _HEADER.size + len(entries) * _ENTRY.size
+    index = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(entries)))
+    moves = bytearray()
+    for size, fleet, cells in entries:
+        index += _ENTRY.pack(size, bytes(fleet), offset + len(moves), len(cells))
+        moves += struct.pack(f"<{len(cells)}{_cell_format(size)}", *cells)
+
+    with open(path, "wb") as f:
+        f.write(index + moves)
@@ -0,0 +1,229 @@
+"""Self-play - partida IA x IA pelo Match, comum a torneios e simulações
+
+Monta os tabuleiros e as frotas, cria um SystemPlayer por lado e joga pelo
+mesmo caminho da GUI (make_attack, Match.process_turn e
+record_attack_result). Tudo é sorteado a partir da semente da partida, com
+geradores random.Random próprios. Também traz o pool de processos e a
+agregação de latências usados pelos dois.
+"""
+
+import os
+import random
+import statistics
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from model.entities.board import Board
+from model.entities.match import Match
+from model.entities.players.system_player import SystemPlayer
+from model.entities.ship import Ship
+from model.entities.ships import default_fleet
+from model.placement import place_fleet
+
+# Tarefas em andamento por worker em run_tasks
+TASKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def game_seed(seed, *parts):
+    """Semente de uma partida, derivada só da semente da execução e de ``parts``"""
+    key = ":".join(str(part) for part in (seed, *parts))
+    return random.Random(key).getrandbits(64)
+
+
+def build_fleet(lengths=None):
+    """Navios da frota: os temáticos por padrão, genéricos se houver tamanhos"""
+    if lengths is None:
+        return default_fleet()
+    return [Ship(f"Navio {i + 1}", length) for i, length in enumerate(lengths)]
+
+
+def play_game(
+    strategies,
+    seed,
+    size=10,
+    fleet=None,
+    first=0,
+    budget_ms=None,
+    use_opening_book=False,
+    use_transposition_table=False,
+    search_workers=0,
+):
+    """
+    Joga uma partida entre duas estratégias até o fim.
+
+    Args:
+        strategies: Par de nomes de estratégia (níveis do SystemPlayer)
+        seed: Semente da partida (frotas e sorteios das estratégias)
+        size: Lado dos tabuleiros
+        fleet: Tamanhos dos navios (padrão: frota temática)
+        first: Índice (0 ou 1) de quem atira primeiro
+        budget_ms: Prazo por jogada (padrão: o de cada nível)
+        use_opening_book: Usa o opening book nos níveis fortes
+        use_transposition_table: Usa a tabela de transposição compartilhada
+            (as jogadas passam a depender das partidas já jogadas no processo)
+        search_workers: Processos da busca Monte Carlo (0 = sem pool)
+
+    Returns:
+        Dicionário com "winner" (índice do vencedor, ou None se ninguém
+        terminou), "turns", "shots" e "hits" de cada lado e "latencies"
+        (arrays com a latência de cada jogada, em ms)
+
+    Raises:
+        ValueError: Se a frota não couber no tabuleiro
+    """
+    rng = random.Random(seed)
+    players = []
+    for index, strategy in enumerate(strategies):
+        board = Board(size)
+        place_fleet(board, build_fleet(fleet), rng)
+        players.append(
+            SystemPlayer(
+                f"p{index + 1}",
+                board,
+                strategy,
+                budget_ms,
+                use_opening_book=use_opening_book,
+                use_transposition_table=use_transposition_table,
+                search_workers=search_workers,
+                rng=random.Random(rng.getrandbits(64)),
+            )
+        )
+
+    match = Match(players[first], players[1 - first])
+    match.start()
+
+    latencies = (array("d"), array("d"))
+    winner = None
+    for _ in range(2 * size * size):
+        player = match.current_player
+        side = 0 if player is players[0] else 1
+        attack = player.make_attack()
+        latencies[side].append(player.last_move_latency_ms)
+        if attack is None:
+            break
+
+        row, col = attack
+        result, ship_destroyed, game_over = match.process_turn(row, col)
+        sunk = match.get_opponent().board.ship_at(row, col) if ship_destroyed else None
+        player.record_attack_result(
+            attack, result, ship_destroyed, sunk.size if sunk else None
+        )
+        if game_over:
+            winner = side
+            break
+        match.switch_player()
+
+    return {
+        "winner": winner,
+        "turns": match.turn + 1,
+        "shots": [players[1].board.shot_count, players[0].board.shot_count],
+        "hits": [players[1].board.hit_count, players[0].board.hit_count],
+        "latencies": latencies,
+    }
+
+
+def run_tasks(function, tasks, workers=None):
+    """
+    Executa ``function(*args)`` para cada ``args`` de ``tasks`` em um pool
+    de processos.
+
+    As tarefas são lidas sob demanda e só TASKS_IN_FLIGHT_PER_WORKER por
+    worker ficam em andamento, então ``tasks`` pode ser um gerador longo.
+
+    Args:
+        function: Função de nível de módulo (enviada aos workers)
+        tasks: Iterável de tuplas de argumentos
+        workers: Processos do pool (padrão: núcleos da máquina; 0 = sem pool)
+
+    Yields:
+        Resultado de cada tarefa, na ordem em que terminam
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 0:
+        for args in tasks:
+            yield function(*args)
+        return
+
+    limit = workers * TASKS_IN_FLIGHT_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for args in tasks:
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(function, *args))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+class LatencyStats:
+    """Latências por jogada (ms) agregadas em contadores.
+
+    Com ``keep_samples`` cada latência também é guardada em um array("d")
+    para os percentis; sem ele a memória é constante.
+    """
+
+    __slots__ = ("_moves", "_total_ms", "_max_ms", "_samples")
+
+    def __init__(self, keep_samples=False):
+        self._moves = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._samples = array("d") if keep_samples else None
+
+    @property
+    def moves(self) -> int:
+        return self._moves
+
+    @property
+    def total_ms(self) -> float:
+        return self._total_ms
+
+    @property
+    def max_ms(self) -> float:
+        return self._max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_ms / self._moves if self._moves else 0.0
+
+    def extend(self, latencies):
+        """Soma as latências de uma sequência de jogadas"""
+        self._moves += len(latencies)
+        self._total_ms += sum(latencies)
+        self._max_ms = max(self._max_ms, max(latencies, default=0.0))
+        if self._samples is not None:
+            self._samples.extend(latencies)
+
+    def add_totals(self, moves, total_ms, max_ms):
+        """Soma jogadas já resumidas (não entram nos percentis)"""
+        self._moves += moves
+        self._total_ms += total_ms
+        self._max_ms = max(self._max_ms, max_ms)
+
+    def merge(self, other):
+        """Soma outro LatencyStats (ex.: o de um worker)"""
+        self._moves += other._moves
+        self._total_ms += other._total_ms
+        self._max_ms = max(self._max_ms, other._max_ms)
+        if self._samples is not None and other._samples is not None:
+            self._samples.extend(other._samples)
+
+    def percentiles(self):
+        """
+        p50, p95 e p99 das latências guardadas.
+
+        Raises:
+            ValueError: Se as amostras não foram guardadas (keep_samples)
+        """
+        values = self._samples
+        if values is None:
+            raise ValueError("Percentis exigem keep_samples=True")
+        if len(values) < 2:
+            value = values[0] if values else 0.0
+            return value, value, value
+        cuts = statistics.quantiles(values, n=100, method="inclusive")
+        return cuts[49], cuts[94], cuts[98]
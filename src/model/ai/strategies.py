@@ -0,0 +1,85 @@
+"""Estratégias de mira - protocolo comum e registro por nome"""
+
+from typing import Optional, Protocol, Tuple
+
+from model.ai.heatmap_targeting import HeatmapTargeting
+from model.ai.hunt_target_targeting import HuntTargetTargeting, RandomTargeting
+from model.ai.monte_carlo_targeting import MonteCarloTargeting
+
+
+class TargetingStrategy(Protocol):
+    """Interface de um motor de mira usado pelo SystemPlayer e pelos torneios."""
+
+    def next_attack(self, deadline_ms=None) -> Optional[Tuple[int, int]]:
+        """Retorna a próxima posição (linha, coluna) a atacar, ou None"""
+        ...
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """Registra o resultado ("water", "hit" ou "already_attacked") de um tiro"""
+        ...
+
+
+def _random(size, ship_sizes, rng, budget_ms, **options):
+    return RandomTargeting(size, rng)
+
+
+def _hunt_target(size, ship_sizes, rng, budget_ms, **options):
+    return HuntTargetTargeting(size, rng)
+
+
+def _heatmap(size, ship_sizes, rng, budget_ms, **options):
+    return HeatmapTargeting(size, ship_sizes, rng)
+
+
+def _monte_carlo(size, ship_sizes, rng, budget_ms, **options):
+    if budget_ms is None:
+        return MonteCarloTargeting(size, ship_sizes, rng, workers=options.get("workers"))
+    return MonteCarloTargeting(
+        size, ship_sizes, rng, deadline_ms=budget_ms, workers=options.get("workers")
+    )
+
+
+# Nome -> factory(size, ship_sizes, rng, budget_ms, **options)
+_FACTORIES = {
+    "random": _random,
+    "hunt_target": _hunt_target,
+    "heatmap": _heatmap,
+    "monte_carlo": _monte_carlo,
+}
+
+
+def strategy_names():
+    """Nomes das estratégias registradas"""
+    return tuple(_FACTORIES)
+
+
+def register_strategy(name, factory):
+    """
+    Registra uma estratégia.
+
+    A factory recebe (size, ship_sizes, rng, budget_ms, **options) e retorna
+    um objeto que segue TargetingStrategy. Para uso em torneios com pool de
+    processos, registre-a em nível de módulo (importado pelos workers).
+    """
+    _FACTORIES[name] = factory
+
+
+def create_strategy(name, size, ship_sizes, rng=None, budget_ms=None, **options):
+    """
+    Cria um motor de mira pelo nome.
+
+    Args:
+        name: Nome registrado da estratégia
+        size: Lado do tabuleiro atacado
+        ship_sizes: Tamanhos dos navios da frota adversária
+        rng: Gerador random.Random (opcional)
+        budget_ms: Prazo padrão por jogada (opcional)
+        **options: Opções específicas (ex.: workers para monte_carlo)
+
+    Raises:
+        ValueError: Se a estratégia não estiver registrada
+    """
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"Estratégia desconhecida: {name}")
+    return factory(size, ship_sizes, rng, budget_ms, **options)
@@ -0,0 +1,171 @@
+"""Tournament - estratégias de mira jogando entre si em um pool de processos
+
+Cada confronto joga partidas com sementes derivadas da semente do torneio,
+pelo mesmo laço e pool de processos da simulação (self_play.play_game e
+run_tasks). As partidas são distribuídas em lotes e o relatório traz, por
+estratégia, taxa de vitória, média de tiros para vencer e latência por
+jogada (p50/p95/p99).
+
+Uso (a partir da raiz do projeto):
+    PYTHONPATH=src python -m model.ai.tournament random hunt_target heatmap --games 1000
+"""
+
+import argparse
+import itertools
+import time
+
+from model.ai.self_play import LatencyStats, game_seed, play_game, run_tasks
+
+# Partidas por tarefa enviada ao pool
+GAMES_PER_TASK = 25
+
+
+def _play_batch(names, size, seeds, firsts, budget_ms):
+    """Joga um lote de partidas e agrega os resultados (executado nos workers)"""
+    wins = [0, 0]
+    winning_shots = [0, 0]
+    latencies = (LatencyStats(keep_samples=True), LatencyStats(keep_samples=True))
+    for seed, first in zip(seeds, firsts):
+        result = play_game(names, seed, size, first=first, budget_ms=budget_ms)
+        winner = result["winner"]
+        if winner is not None:
+            wins[winner] += 1
+            winning_shots[winner] += result["shots"][winner]
+        latencies[0].extend(result["latencies"][0])
+        latencies[1].extend(result["latencies"][1])
+    return tuple(names), len(seeds), wins, winning_shots, latencies
+
+
+def _batches(pairs, games, size, seed, budget_ms):
+    """Argumentos de _play_batch de cada lote; quem começa alterna a cada partida"""
+    for pair in pairs:
+        for start in range(0, games, GAMES_PER_TASK):
+            indices = range(start, min(start + GAMES_PER_TASK, games))
+            seeds = [game_seed(seed, pair[0], pair[1], game) for game in indices]
+            firsts = [game % 2 for game in indices]
+            yield pair, size, seeds, firsts, budget_ms
+
+
+def run_tournament(names, games=1000, size=10, seed=0, workers=None, budget_ms=None):
+    """
+    Joga todos os confrontos entre as estratégias.
+
+    Args:
+        names: Nomes das estratégias (uma só = jogos contra si mesma)
+        games: Partidas por confronto
+        size: Lado dos tabuleiros
+        seed: Semente do torneio
+        workers: Processos do pool (padrão: núcleos da máquina; 0 = sem pool)
+        budget_ms: Prazo por jogada das estratégias (opcional)
+
+    Returns:
+        Dicionário com o relatório por estratégia ("strategies") e por
+        confronto ("matchups")
+    """
+    names = list(names)
+    pairs = list(itertools.combinations(names, 2)) or [(names[0], names[0])]
+
+    stats = {
+        name: {
+            "games": 0,
+            "wins": 0,
+            "winning_shots": 0,
+            "latency": LatencyStats(keep_samples=True),
+        }
+        for name in names
+    }
+    matchups = {pair: [0, 0, 0] for pair in pairs}  # vitórias de cada lado e jogos
+    started = time.perf_counter()
+    batches = _batches(pairs, games, size, seed, budget_ms)
+    for pair, played, wins, winning_shots, latencies in run_tasks(
+        _play_batch, batches, workers
+    ):
+        matchup = matchups[pair]
+        matchup[0] += wins[0]
+        matchup[1] += wins[1]
+        matchup[2] += played
+        for side, name in enumerate(pair):
+            entry = stats[name]
+            entry["games"] += played
+            entry["wins"] += wins[side]
+            entry["winning_shots"] += winning_shots[side]
+            entry["latency"].merge(latencies[side])
+    elapsed = time.perf_counter() - started
+
+    report = {}
+    for name, entry in stats.items():
+        p50, p95, p99 = entry["latency"].percentiles()
+        report[name] = {
+            "games": entry["games"],
+            "wins": entry["wins"],
+            "win_rate": entry["wins"] / entry["games"] if entry["games"] else 0.0,
+            "mean_shots_to_win": (
+                entry["winning_shots"] / entry["wins"] if entry["wins"] else None
+            ),
+            "moves": entry["latency"].moves,
+            "latency_p50_ms": p50,
+            "latency_p95_ms": p95,
+            "latency_p99_ms": p99,
+        }
+
+    return {
+        "strategies": report,
+        "matchups": [
+            {
+                "first": pair[0],
+                "second": pair[1],
+                "games": games_played,
+                "first_wins": first_wins,
+                "second_wins": second_wins,
+            }
+            for pair, (first_wins, second_wins, games_played) in matchups.items()
+        ],
+        "size": size,
+        "seed": seed,
+        "elapsed_s": elapsed,
+    }
+
+
+def format_report(report):
+    """Relatório do torneio como texto"""
+    lines = [
+        f"{'estratégia':<14}{'jogos':>7}{'vitórias':>10}{'tiros/vitória':>15}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    ]
+    for name, entry in report["strategies"].items():
+        shots = entry["mean_shots_to_win"]
+        lines.append(
+            f"{name:<14}{entry['games']:>7}{entry['win_rate']:>10.1%}"
+            f"{shots if shots is not None else float('nan'):>15.2f}"
+            f"{entry['latency_p50_ms']:>10.3f}{entry['latency_p95_ms']:>10.3f}"
+            f"{entry['latency_p99_ms']:>10.3f}"
+        )
+    lines.append("")
+    for matchup in report["matchups"]:
+        lines.append(
+            f"{matchup['first']} x {matchup['second']}: "
+            f"{matchup['first_wins']} x {matchup['second_wins']} "
+            f"em {matchup['games']} jogos"
+        )
+    lines.append(f"Tempo total: {report['elapsed_s']:.1f}s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Torneio entre estratégias de mira")
+    parser.add_argument("strategies", nargs="+", help="Nomes das estratégias")
+    parser.add_argument("--games", type=int, default=1000, help="Jogos por confronto")
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    report = run_tournament(
+        args.strategies, args.games, args.size, args.seed, args.workers, args.budget_ms
+    )
+    print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Tabela de transposição - decisões da IA por hash Zobrist do conhecimento"""
+
+from collections import OrderedDict
+
+# Capacidade padrão da tabela compartilhada (entradas)
+DEFAULT_CAPACITY = 10_000
+
+# Células de mapas de calor guardadas, no máximo, somando todas as entradas
+DEFAULT_HEATMAP_CELLS = 1_000_000
+
+# Estados de uma célula atacada no hash
+MISS = 0
+OPEN_HIT = 1
+SUNK = 2
+
+_MASK64 = (1 << 64) - 1
+
+
+def zobrist_key(index):
+    """
+    Chave pseudoaleatória de 64 bits para um índice (splitmix64).
+
+    As chaves são uma função fixa do índice, então o hash de um mesmo
+    conhecimento é igual em todos os processos sem tabela de chaves.
+    """
+    z = (index + 1) * 0x9E3779B97F4A7C15 & _MASK64
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & _MASK64
+    return z ^ (z >> 31)
+
+
+def cell_key(cell, state):
+    """Chave de uma célula atacada em um estado (MISS, OPEN_HIT ou SUNK)"""
+    return zobrist_key(cell << 2 | state)
+
+
+def fleet_key(length, count):
+    """Chave de ``count`` navios de tamanho ``length`` ainda não afundados"""
+    return zobrist_key((length << 20 | count) << 2 | 3)
+
+
+def _heatmap_cells(heatmap):
+    """Número de células de um mapa de calor (array NumPy ou tupla de linhas)"""
+    if heatmap is None:
+        return 0
+    size = getattr(heatmap, "size", None)
+    if isinstance(size, int):
+        return size
+    return sum(len(row) for row in heatmap)
+
+
+class TranspositionTable:
+    """Cache LRU limitado de decisões da IA.
+
+    Cada entrada guarda a jogada escolhida e, opcionalmente, o mapa de calor
+    do estado. A tabela é limitada em entradas e, para os mapas de calor, no
+    total de células guardadas, então a memória não cresce com o tamanho do
+    tabuleiro. Os contadores de acertos e falhas medem quanto das avaliações
+    é evitado.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_heatmap_capacity",
+        "_heatmap_cells",
+        "_entries",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, heatmap_cells=DEFAULT_HEATMAP_CELLS):
+        """
+        Args:
+            capacity: Máximo de entradas
+            heatmap_cells: Máximo de células de mapas de calor somadas
+        """
+        if capacity <= 0:
+            raise ValueError("Capacidade deve ser positiva")
+        self._capacity = capacity
+        self._heatmap_capacity = heatmap_cells
+        self._heatmap_cells = 0
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas encontradas na tabela."""
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def get(self, key):
+        """Retorna (jogada, mapa de calor) do estado, ou None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[:2]
+
+    def put(self, key, move, heatmap=None):
+        """Guarda a decisão de um estado, descartando as menos usadas se cheia"""
+        cells = _heatmap_cells(heatmap)
+        if cells > self._heatmap_capacity:
+            heatmap, cells = None, 0  # Mapa maior que o limite: guarda só a jogada
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._heatmap_cells -= old[2]
+        self._entries[key] = (move, heatmap, cells)
+        self._heatmap_cells += cells
+        while (
+            len(self._entries) > self._capacity
+            or self._heatmap_cells > self._heatmap_capacity
+        ):
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._heatmap_cells -= evicted
+
+    def get_stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "capacity": self._capacity,
+            "heatmap_cells": self._heatmap_cells,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        """Remove todas as entradas e zera os contadores"""
+        self._entries.clear()
+        self._heatmap_cells = 0
+        self._hits = 0
+        self._misses = 0
+
+
+# Tabela compartilhada pelos SystemPlayers do processo
+shared_table = TranspositionTable()
+
+
+class CachedTargeting:
+    """Consulta a tabela de transposição antes de avaliar uma posição.
+
+    A chave combina o motor, o tamanho do tabuleiro, a frota inicial, o
+    prazo da jogada e o hash Zobrist do conhecimento, mantido de forma
+    incremental por BoardKnowledge. Em um acerto a avaliação do motor é
+    pulada; o motor continua recebendo todos os resultados. Jogadas de um
+    motor que não amostrou nada (``last_samples == 0``) não são guardadas. Por padrão só a jogada é
+    guardada; os mapas de calor entram na tabela com ``store_heatmaps``.
+    """
+
+    def __init__(self, engine, size, ship_sizes, table=None, store_heatmaps=False):
+        """
+        Args:
+            engine: Motor de mira com ``knowledge`` e ``last_heatmap``
+            size: Lado do tabuleiro atacado
+            ship_sizes: Tamanhos dos navios da frota adversária
+            table: TranspositionTable (padrão: a tabela compartilhada)
+            store_heatmaps: Guarda também o mapa de calor de cada decisão
+        """
+        self._engine = engine
+        self._table = shared_table if table is None else table
+        self._store_heatmaps = store_heatmaps
+        self._namespace = (
+            type(engine).__name__,
+            size,
+            tuple(sorted(ship_sizes, reverse=True)),
+        )
+        self._heatmap = None
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def table(self) -> TranspositionTable:
+        return self._table
+
+    @property
+    def knowledge(self):
+        return self._engine.knowledge
+
+    @property
+    def last_heatmap(self):
+        """Mapa de calor da última decisão (None se veio do cache sem mapa)."""
+        return self._heatmap
+
+    def next_attack(self, deadline_ms=None):
+        """Retorna a próxima posição (linha, coluna) a atacar, ou None"""
+        # O prazo entra na chave: jogadas de buscas curtas não valem para longas
+        key = self._namespace + (deadline_ms, self._engine.knowledge.zobrist)
+        entry = self._table.get(key)
+        if entry is not None:
+            move, self._heatmap = entry
+            return move
+
+        move = self._engine.next_attack(deadline_ms)
+        self._heatmap = self._engine.last_heatmap
+        # Sem amostras (Monte Carlo sem tempo) a jogada é só um palpite
+        if move is not None and getattr(self._engine, "last_samples", None) != 0:
+            self._table.put(key, move, self._heatmap if self._store_heatmaps else None)
+        return move
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
+        """Repassa o resultado ao motor"""
+        self._engine.record_attack_result(position, result, ship_destroyed, ship_size)
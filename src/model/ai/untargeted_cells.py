@@ -0,0 +1,57 @@
+"""UntargetedCells - células ainda não atacadas com sorteio e remoção O(1)"""
+
+import random
+
+
+class UntargetedCells:
+    """Conjunto das células não atacadas de um tabuleiro.
+
+    As células ficam em um array virtual de ``size * size`` posições: as
+    primeiras ``count`` são as não atacadas. Remover uma célula troca-a com
+    a última ativa (swap-remove) e um mapa célula -> posição permite achá-la
+    em O(1). Só as posições que já foram trocadas são guardadas (as demais
+    guardam a própria célula), então criar o conjunto é O(1) e a memória
+    cresce com o número de tiros, não com a área do tabuleiro.
+    """
+
+    __slots__ = ("_size", "_count", "_slots", "_cells")
+
+    def __init__(self, size):
+        self._size = size
+        self._count = size * size
+        self._slots = {}  # posição -> célula, só para posições trocadas
+        self._cells = {}  # célula -> posição, só para células trocadas
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, position):
+        row, col = position
+        if not (0 <= row < self._size and 0 <= col < self._size):
+            return False
+        cell = row * self._size + col
+        return self._cells.get(cell, cell) < self._count
+
+    def choice(self, rng=random):
+        """Sorteia uma posição (linha, coluna) não atacada, ou None se não houver"""
+        if not self._count:
+            return None
+        slot = rng.randrange(self._count)
+        return divmod(self._slots.get(slot, slot), self._size)
+
+    def discard(self, position):
+        """Remove uma posição atacada. Retorna False se ela já tinha sido removida"""
+        if position not in self:
+            return False
+        row, col = position
+        cell = row * self._size + col
+        slot = self._cells.get(cell, cell)
+
+        last = self._count - 1
+        last_cell = self._slots.get(last, last)
+        self._slots[slot] = last_cell
+        self._cells[last_cell] = slot
+        self._slots[last] = cell
+        self._cells[cell] = last
+        self._count = last
+        return True
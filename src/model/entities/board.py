@@ -1,15 +1,83 @@
 """Classe Board - representa o tabuleiro de batalha naval"""
 
+import struct
+
+from model.entities.ship import Ship
+from model.entities.ships import SHIP_TYPES
+
+# Formato binário de to_bytes/from_bytes (little-endian):
+#   cabeçalho: magic "SB", versão, layout, size (u32), número de navios (u16)
+#   navio: (código do tipo << 1 | horizontal) u8, tamanho u8, célula inicial
+#   layout 0 (bitmaps): bitmap de ataques + bitmap de acertos
+#   layout 1 (lista): número de ataques, células atacadas, bitmap de acertos
+#                     alinhado com a lista
+# Células usam u16, u32 ou u64 conforme a área do tabuleiro.
+_MAGIC = b"SB"
+_VERSION = 1
+_HEADER = struct.Struct("<2sBBIH")
+_LAYOUT_BITMAPS = 0
+_LAYOUT_CELL_LIST = 1
+_SHIP_CODES = {ship_type: code for code, ship_type in enumerate(SHIP_TYPES, 1)}
+
+# Códigos numéricos dos resultados de receive_attack (logs de partida e lotes)
+WATER = 0
+HIT = 1
+ALREADY_ATTACKED = 2
+RESULTS = ("water", "hit", "already_attacked")
+RESULT_CODES = {result: code for code, result in enumerate(RESULTS)}
+
+
+def _cell_format(size):
+    """Formato struct das células para um tabuleiro de lado size"""
+    area = size * size
+    if area <= 0xFFFF:
+        return "H"
+    if area <= 0xFFFFFFFF:
+        return "I"
+    return "Q"
+
 
 class Board:
-    """Tabuleiro de batalha naval com grid de células"""
+    """Tabuleiro de batalha naval com grid de células.
+
+    O estado é mantido em bitmasks inteiros (um bit por célula, índice
+    ``row * size + col``): ocupação por navios, posições atacadas e acertos.
+    ``grid``, ``attacks`` e ``hits`` são visões construídas sob demanda para
+    as telas e invalidadas a cada alteração do tabuleiro.
+    """
+
+    __slots__ = (
+        "_size",
+        "_ships",
+        "_cell_ships",
+        "_ship_mask",
+        "_attack_mask",
+        "_hit_mask",
+        "_grid_view",
+        "_ships_afloat",
+        "_cells_remaining",
+        "_shot_count",
+        "_hit_count",
+        "_undo_stack",
+    )
 
     def __init__(self, size=10):
         self._size = size
-        self._grid = [["~" for _ in range(size)] for _ in range(size)]
         self._ships = []
-        self._attacks = set()  # Posições já atacadas
-        self._hits = set()  # Posições que acertaram navios
+        self._cell_ships = {}  # Índice da célula -> navio que a ocupa
+        self._ship_mask = 0  # Células ocupadas por navios
+        self._attack_mask = 0  # Posições já atacadas
+        self._hit_mask = 0  # Posições que acertaram navios
+        self._grid_view = None  # Cache da visão em grid
+
+        # Contadores incrementais (atualizados em add_ship/receive_attack)
+        self._ships_afloat = 0
+        self._cells_remaining = 0
+        self._shot_count = 0
+        self._hit_count = 0
+
+        # Células aplicadas via apply_attack (None = ataque repetido), para undo_attack
+        self._undo_stack = []
 
     # Propriedades de acesso
     @property
@@ -18,80 +86,323 @@ class Board:
 
     @property
     def grid(self):
-        return self._grid
+        if self._grid_view is None:
+            self._grid_view = self._build_grid()
+        return self._grid_view
 
     @property
     def ships(self):
         return self._ships
 
+    @property
+    def occupied_mask(self) -> int:
+        """Bitmask das células ocupadas por navios (bit ``row * size + col``)."""
+        return self._ship_mask
+
+    @property
+    def occupied_cells(self):
+        """Índices das células ocupadas por navios (visão somente leitura)."""
+        return self._cell_ships.keys()
+
     @property
     def attacks(self):
-        return self._attacks
+        return set(self._iter_positions(self._attack_mask))
 
     @property
     def hits(self):
-        return self._hits
+        return set(self._iter_positions(self._hit_mask))
 
-    def add_ship(self, ship, start_row, start_col, horizontal=True):
-        """Adiciona um navio ao tabuleiro"""
-        positions = []
+    @property
+    def ships_remaining(self) -> int:
+        """Número de navios ainda não destruídos."""
+        return self._ships_afloat
 
-        # Calcula posições do navio
-        for i in range(ship.size):
-            if horizontal:
-                row, col = start_row, start_col + i
-            else:
-                row, col = start_row + i, start_col
+    @property
+    def cells_remaining(self) -> int:
+        """Número de células de navio ainda não atingidas."""
+        return self._cells_remaining
+
+    @property
+    def shot_count(self) -> int:
+        """Número de ataques recebidos (sem contar repetidos)."""
+        return self._shot_count
+
+    @property
+    def hit_count(self) -> int:
+        """Número de ataques recebidos que acertaram navios."""
+        return self._hit_count
 
-            # Verifica limites do tabuleiro
-            if row >= self._size or col >= self._size:
-                raise ValueError("Navio fora dos limites do tabuleiro")
+    def get_status(self):
+        """Retorna os contadores do tabuleiro sem percorrer navios ou células"""
+        return {
+            "ships_total": len(self._ships),
+            "ships_remaining": self._ships_afloat,
+            "cells_remaining": self._cells_remaining,
+            "shots": self._shot_count,
+            "hits": self._hit_count,
+        }
+
+    def _build_grid(self):
+        """Monta a visão list-of-lists com os marcadores de cada célula"""
+        size = self._size
+        ships = self._ship_mask
+        attacks = self._attack_mask
+        hits = self._hit_mask
+        grid = []
+        for row in range(size):
+            line = []
+            for col in range(size):
+                bit = 1 << (row * size + col)
+                if hits & bit:
+                    line.append("X")  # X = acerto
+                elif attacks & bit:
+                    line.append("O")  # O = água/erro
+                elif ships & bit:
+                    line.append("N")  # N = navio
+                else:
+                    line.append("~")
+            grid.append(line)
+        return grid
+
+    def _iter_positions(self, mask):
+        """Converte uma máscara de bits em tuplas (linha, coluna)"""
+        size = self._size
+        while mask:
+            low = mask & -mask
+            yield divmod(low.bit_length() - 1, size)
+            mask ^= low
+
+    def ship_at(self, row, col):
+        """Retorna o navio que ocupa a posição, ou None se for água"""
+        return self._cell_ships.get(row * self._size + col)
+
+    def is_attacked(self, row, col):
+        """Verifica se uma posição já foi atacada"""
+        return bool(self._attack_mask >> (row * self._size + col) & 1)
+
+    def add_ship(self, ship, start_row, start_col, horizontal=True):
+        """Adiciona um navio ao tabuleiro"""
+        size = self._size
+        end_row = start_row if horizontal else start_row + ship.size - 1
+        end_col = start_col + ship.size - 1 if horizontal else start_col
 
-            # Verifica colisão
-            if self._grid[row][col] != "~":
-                raise ValueError("Posição já ocupada por outro navio")
+        # Verifica limites do tabuleiro
+        if start_row < 0 or start_col < 0 or end_row >= size or end_col >= size:
+            raise ValueError("Navio fora dos limites do tabuleiro")
 
-            positions.append((row, col))
+        # Verifica colisão
+        step = 1 if horizontal else size
+        start = start_row * size + start_col
+        cells = range(start, start + ship.size * step, step)
+        if self._is_occupied(cells):
+            raise ValueError("Posição já ocupada por outro navio")
 
         # Posiciona o navio
-        ship.place(positions)
-        for row, col in positions:
-            self._grid[row][col] = "N"  # N = navio
+        ship.place_at(start_row, start_col, horizontal)
 
+        self._occupy(cells, ship)
         self._ships.append(ship)
+        self._ships_afloat += 1
+        self._cells_remaining += ship.size
+        self._grid_view = None
+
+    def _is_occupied(self, cells):
+        """Verifica se alguma das células já pertence a um navio"""
+        mask = 0
+        for cell in cells:
+            mask |= 1 << cell
+        return bool(self._ship_mask & mask)
+
+    def _occupy(self, cells, ship):
+        """Marca as células como ocupadas pelo navio"""
+        for cell in cells:
+            self._ship_mask |= 1 << cell
+            self._cell_ships[cell] = ship
 
     def receive_attack(self, row, col):
         """
         Processa um ataque em uma posição.
         Retorna: ('water', None) ou ('hit', ship) ou ('already_attacked', None)
         """
-        position = (row, col)
+        if row < 0 or col < 0 or row >= self._size or col >= self._size:
+            raise ValueError("Ataque fora dos limites do tabuleiro")
+
+        index = row * self._size + col
+        bit = 1 << index
 
         # Verifica se já foi atacado
-        if position in self._attacks:
+        if self._attack_mask & bit:
             return ("already_attacked", None)
 
-        self._attacks.add(position)
-
-        # Verifica se acertou algum navio
-        for ship in self._ships:
-            if ship.receive_attack(position):
-                self._hits.add(position)
-                self._grid[row][col] = "X"  # X = acerto
-                return ("hit", ship)
+        self._attack_mask |= bit
+        self._shot_count += 1
+        self._grid_view = None
 
         # Água
-        self._grid[row][col] = "O"  # O = água/erro
-        return ("water", None)
+        if not self._ship_mask & bit:
+            return ("water", None)
+
+        # Acertou um navio: o índice resolve o dono da célula
+        self._hit_mask |= bit
+        self._hit_count += 1
+        self._cells_remaining -= 1
+        ship = self._cell_ships[index]
+        ship.receive_attack((row, col))
+        if ship.is_destroyed():
+            self._ships_afloat -= 1
+        return ("hit", ship)
+
+    def apply_attack(self, row, col):
+        """
+        Aplica um ataque que pode ser desfeito com undo_attack (make/unmake).
+        Retorna o mesmo que receive_attack.
+        """
+        result, ship = self.receive_attack(row, col)
+        if result == "already_attacked":
+            self._undo_stack.append(None)
+        else:
+            self._undo_stack.append(row * self._size + col)
+        return (result, ship)
+
+    def undo_attack(self):
+        """Desfaz o último apply_attack em O(1), restaurando navios e contadores"""
+        if not self._undo_stack:
+            raise ValueError("Nenhum ataque para desfazer")
+
+        cell = self._undo_stack.pop()
+        if cell is None:
+            return
+
+        ship = self._cell_ships.get(cell)
+        self._unmark_attack(cell, ship is not None)
+        self._shot_count -= 1
+
+        if ship is not None:
+            if ship.is_destroyed():
+                self._ships_afloat += 1
+            ship.remove_hit(divmod(cell, self._size))
+            self._hit_count -= 1
+            self._cells_remaining += 1
+
+    def _unmark_attack(self, cell, hit):
+        """Remove a marcação de ataque (e de acerto) de uma célula"""
+        bit = 1 << cell
+        self._attack_mask ^= bit
+        if hit:
+            self._hit_mask ^= bit
+        self._grid_view = None
+
+    # Layout usado por to_bytes para os ataques
+    _BYTES_LAYOUT = _LAYOUT_BITMAPS
+
+    def to_bytes(self):
+        """
+        Serializa frota e ataques em formato binário compacto e versionado.
+        Um tabuleiro 10x10 com 5 navios ocupa 56 bytes. A pilha de
+        apply_attack não é serializada.
+        """
+        size = self._size
+        cell_fmt = _cell_format(size)
+        ships = self._ships
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, self._BYTES_LAYOUT, size, len(ships))
+        ]
+
+        ship_struct = struct.Struct("<BB" + cell_fmt)
+        for ship in ships:
+            row, col = ship.positions[0]
+            code = _SHIP_CODES.get(type(ship), 0)
+            parts.append(
+                ship_struct.pack(code << 1 | ship.horizontal, ship.size, row * size + col)
+            )
+
+        parts.append(self._pack_attacks(cell_fmt))
+        return b"".join(parts)
+
+    def _pack_attacks(self, cell_fmt):
+        """Serializa os ataques como bitmaps de ataques e acertos"""
+        nbytes = (self._size * self._size + 7) // 8
+        return self._attack_mask.to_bytes(nbytes, "little") + self._hit_mask.to_bytes(
+            nbytes, "little"
+        )
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reconstrói um tabuleiro serializado por to_bytes"""
+        data = memoryview(data)
+        try:
+            magic, version, layout, size, ship_count = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("Dados de tabuleiro truncados")
+        if magic != _MAGIC:
+            raise ValueError("Dados não são um tabuleiro serializado")
+        if version != _VERSION:
+            raise ValueError(f"Versão de tabuleiro não suportada: {version}")
+
+        board = cls(size)
+        cell_fmt = _cell_format(size)
+        offset = _HEADER.size
+        try:
+            ship_struct = struct.Struct("<BB" + cell_fmt)
+            for _ in range(ship_count):
+                flags, length, start = ship_struct.unpack_from(data, offset)
+                offset += ship_struct.size
+                code = flags >> 1
+                if code == 0:
+                    ship = Ship("Navio", length)
+                elif code <= len(SHIP_TYPES):
+                    ship = SHIP_TYPES[code - 1]()
+                else:
+                    raise ValueError(f"Código de navio desconhecido: {code}")
+                if ship.size != length:
+                    raise ValueError(f"Tamanho inválido para {ship.name}: {length}")
+                row, col = divmod(start, size)
+                board.add_ship(ship, row, col, bool(flags & 1))
+
+            if layout == _LAYOUT_BITMAPS:
+                nbytes = (size * size + 7) // 8
+                attacks = int.from_bytes(data[offset : offset + nbytes], "little")
+                hits = int.from_bytes(
+                    data[offset + nbytes : offset + 2 * nbytes], "little"
+                )
+                offset += 2 * nbytes
+                cells = []
+                while attacks:
+                    low = attacks & -attacks
+                    cells.append(low.bit_length() - 1)
+                    attacks ^= low
+                hit_flags = [hits >> cell & 1 for cell in cells]
+            elif layout == _LAYOUT_CELL_LIST:
+                cell_size = struct.calcsize(cell_fmt)
+                (count,) = struct.unpack_from("<" + cell_fmt, data, offset)
+                offset += cell_size
+                cells = struct.unpack_from(f"<{count}{cell_fmt}", data, offset)
+                offset += count * cell_size
+                nbytes = (count + 7) // 8
+                hits = int.from_bytes(data[offset : offset + nbytes], "little")
+                offset += nbytes
+                hit_flags = [hits >> i & 1 for i in range(count)]
+            else:
+                raise ValueError(f"Layout de tabuleiro desconhecido: {layout}")
+        except struct.error:
+            raise ValueError("Dados de tabuleiro truncados")
+
+        if offset > len(data):
+            raise ValueError("Dados de tabuleiro truncados")
+        if offset < len(data):
+            raise ValueError("Dados de tabuleiro com bytes sobrando")
+
+        # Reaplica os ataques e confere os acertos gravados
+        for cell, hit in zip(cells, hit_flags):
+            row, col = divmod(cell, size)
+            result, _ = board.receive_attack(row, col)
+            if (result == "hit") != bool(hit):
+                raise ValueError("Acertos gravados não batem com a frota")
+        return board
 
     def all_ships_destroyed(self):
         """Verifica se todos os navios foram destruídos"""
-        result = all(ship.is_destroyed() for ship in self._ships)
-        destroyed_count = sum(1 for ship in self._ships if ship.is_destroyed())
-        print(
-            f"[Board] all_ships_destroyed: {result} ({destroyed_count}/{len(self._ships)} navios destruídos)"
-        )
-        return result
+        return self._ships_afloat == 0
 
     def show(self, hide_ships=False):
         """Retorna representação visual do tabuleiro"""
@@ -100,7 +411,7 @@ class Board:
         lines.append("   " + " ".join(str(i) for i in range(self._size)))
         lines.append("  " + "-" * (self._size * 2 + 1))
 
-        for i, row in enumerate(self._grid):
+        for i, row in enumerate(self.grid):
             cells = []
             for j, cell in enumerate(row):
                 if hide_ships and cell == "N":
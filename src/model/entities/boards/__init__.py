@@ -0,0 +1,9 @@
+"""Board classes - variantes do tabuleiro de batalha naval"""
+
+from .batch_board import BatchBoard
+from .sparse_board import SparseBoard
+
+__all__ = [
+    "BatchBoard",
+    "SparseBoard",
+]
@@ -0,0 +1,185 @@
+"""Batch Board - N tabuleiros independentes resolvidos com NumPy"""
+
+from model.entities.board import ALREADY_ATTACKED, HIT, RESULTS, WATER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BatchBoard:
+    """Avança N partidas independentes de uma vez.
+
+    Cada célula guarda o id do navio que a ocupa (0 = água) em um array
+    ``(N, size, size)``, junto com a máscara de células atacadas e o número
+    de células restantes de cada navio. ``receive_attacks`` resolve um tiro
+    por partida em uma única chamada vetorizada, com a mesma semântica de
+    water/hit/already_attacked de Board.
+    """
+
+    def __init__(self, n_games, size=10, max_ships=8):
+        """
+        Inicializa N tabuleiros vazios.
+
+        Args:
+            n_games: Número de partidas simultâneas
+            size: Lado de cada tabuleiro
+            max_ships: Número máximo de navios por tabuleiro
+
+        Raises:
+            RuntimeError: Se o NumPy não estiver instalado
+        """
+        if np is None:
+            raise RuntimeError(
+                "numpy is not installed. Install with `pip install numpy`."
+            )
+
+        self._n_games = n_games
+        self._size = size
+        self._max_ships = max_ships
+        self._ship_ids = np.zeros((n_games, size, size), dtype=np.int16)
+        self._attacked = np.zeros((n_games, size, size), dtype=bool)
+        self._ship_lengths = np.zeros((n_games, max_ships), dtype=np.int16)
+        self._remaining = np.zeros((n_games, max_ships), dtype=np.int16)
+        self._ship_count = np.zeros(n_games, dtype=np.int16)
+        self._ships_afloat = np.zeros(n_games, dtype=np.int16)
+
+    @classmethod
+    def from_boards(cls, boards, max_ships=None):
+        """Cria um BatchBoard com a frota e os ataques de uma lista de Boards"""
+        size = boards[0].size
+        if max_ships is None:
+            max_ships = max((len(board.ships) for board in boards), default=1)
+        batch = cls(len(boards), size, max(max_ships, 1))
+        for game, board in enumerate(boards):
+            if board.size != size:
+                raise ValueError("Todos os tabuleiros devem ter o mesmo tamanho")
+            for ship in board.ships:
+                row, col = ship.positions[0]
+                batch.place_ship(game, row, col, ship.size, ship.horizontal)
+            for row, col in board.attacks:
+                batch.receive_attack(game, row, col)
+        return batch
+
+    @classmethod
+    def from_layouts(cls, layouts, max_ships=None):
+        """Cria um BatchBoard com as frotas de um LayoutBatch (model.placement)"""
+        n_ships = len(layouts.lengths)
+        batch = cls(len(layouts), layouts.size, max(max_ships or n_ships, n_ships, 1))
+        games = np.arange(len(layouts))[:, None]
+        ship_ids = batch._ship_ids.reshape(len(layouts), -1)
+        for ship, length in enumerate(layouts.lengths):
+            ship_ids[games, layouts.cells(ship)] = ship + 1
+            batch._ship_lengths[:, ship] = length
+            batch._remaining[:, ship] = length
+        batch._ship_count[:] = n_ships
+        batch._ships_afloat[:] = n_ships
+        return batch
+
+    # Propriedades de acesso
+    @property
+    def n_games(self) -> int:
+        return self._n_games
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def ship_ids(self):
+        """Array (N, size, size) com o id do navio em cada célula (0 = água)."""
+        return self._ship_ids
+
+    @property
+    def attacked(self):
+        """Array (N, size, size) de células já atacadas."""
+        return self._attacked
+
+    @property
+    def ships_remaining(self):
+        """Array (N,) com o número de navios ainda não destruídos."""
+        return self._ships_afloat
+
+    def place_ship(self, game, start_row, start_col, length, horizontal=True):
+        """Adiciona um navio ao tabuleiro de uma partida. Retorna o id do navio"""
+        size = self._size
+        end_row = start_row if horizontal else start_row + length - 1
+        end_col = start_col + length - 1 if horizontal else start_col
+
+        # Verifica limites do tabuleiro
+        if start_row < 0 or start_col < 0 or end_row >= size or end_col >= size:
+            raise ValueError("Navio fora dos limites do tabuleiro")
+
+        slot = int(self._ship_count[game])
+        if slot >= self._max_ships:
+            raise ValueError(f"Limite de {self._max_ships} navios por tabuleiro")
+
+        cells = self._ship_ids[game, start_row : end_row + 1, start_col : end_col + 1]
+
+        # Verifica colisão
+        if cells.any():
+            raise ValueError("Posição já ocupada por outro navio")
+
+        ship_id = slot + 1
+        cells[...] = ship_id
+        self._ship_lengths[game, slot] = length
+        self._remaining[game, slot] = length
+        self._ship_count[game] += 1
+        self._ships_afloat[game] += 1
+        return ship_id
+
+    def receive_attacks(self, rows, cols, games=None):
+        """
+        Processa um ataque por partida.
+
+        Args:
+            rows: Linhas dos ataques (uma por partida)
+            cols: Colunas dos ataques (uma por partida)
+            games: Índices das partidas atacadas (padrão: todas, em ordem).
+                Cada partida deve aparecer no máximo uma vez.
+
+        Returns:
+            Tupla (codes, sunk): códigos WATER/HIT/ALREADY_ATTACKED e se o
+            ataque destruiu um navio
+        """
+        if games is None:
+            games = np.arange(self._n_games)
+        games = np.asarray(games, dtype=np.intp)
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+
+        if ((rows < 0) | (rows >= self._size) | (cols < 0) | (cols >= self._size)).any():
+            raise ValueError("Ataque fora dos limites do tabuleiro")
+
+        already = self._attacked[games, rows, cols]
+        ids = self._ship_ids[games, rows, cols]
+        self._attacked[games, rows, cols] = True
+
+        hit = (ids > 0) & ~already
+        codes = np.full(len(games), WATER, dtype=np.int8)
+        codes[hit] = HIT
+        codes[already] = ALREADY_ATTACKED
+
+        # Desconta a célula do navio atingido e detecta afundamentos
+        hit_games = games[hit]
+        hit_slots = ids[hit].astype(np.intp) - 1
+        self._remaining[hit_games, hit_slots] -= 1
+        sunk_hits = self._remaining[hit_games, hit_slots] == 0
+        self._ships_afloat[hit_games[sunk_hits]] -= 1
+
+        sunk = np.zeros(len(games), dtype=bool)
+        sunk[hit] = sunk_hits
+        return codes, sunk
+
+    def receive_attack(self, game, row, col):
+        """
+        Processa um ataque em uma única partida.
+        Retorna: (resultado, navio_destruído) com os resultados de Board
+        """
+        codes, sunk = self.receive_attacks([row], [col], games=[game])
+        return (RESULTS[codes[0]], bool(sunk[0]))
+
+    def all_ships_destroyed(self):
+        """Array (N,) indicando as partidas com todos os navios destruídos"""
+        return self._ships_afloat == 0
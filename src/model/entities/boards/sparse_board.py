@@ -0,0 +1,169 @@
+"""Sparse Board - tabuleiro esparso para oceanos muito grandes"""
+
+import struct
+
+from model.entities.board import _LAYOUT_CELL_LIST, Board
+
+# Maior área para a qual occupied_mask monta a bitmask do tabuleiro inteiro
+MASK_AREA_LIMIT = 1 << 16
+
+
+class _SparseRow:
+    """Linha somente leitura da visão em grid de um SparseBoard"""
+
+    __slots__ = ("_board", "_offset")
+
+    def __init__(self, board, row):
+        self._board = board
+        self._offset = row * board.size
+
+    def __len__(self):
+        return self._board.size
+
+    def __getitem__(self, col):
+        if col < 0 or col >= self._board.size:
+            raise IndexError("Coluna fora dos limites do tabuleiro")
+        return self._board._marker(self._offset + col)
+
+    def __iter__(self):
+        for col in range(self._board.size):
+            yield self._board._marker(self._offset + col)
+
+
+class _SparseGrid:
+    """Visão em grid (``grid[row][col]``) calculada célula a célula"""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return self._board.size
+
+    def __getitem__(self, row):
+        if row < 0 or row >= self._board.size:
+            raise IndexError("Linha fora dos limites do tabuleiro")
+        return _SparseRow(self._board, row)
+
+    def __iter__(self):
+        for row in range(self._board.size):
+            yield _SparseRow(self._board, row)
+
+
+class SparseBoard(Board):
+    """Tabuleiro cuja memória é proporcional aos navios e ataques, não à área.
+
+    Guarda apenas o índice célula -> navio e o conjunto de células atacadas,
+    então tabuleiros de até 100k×100k podem ser usados em simulações. A API é
+    a mesma de Board; ``grid`` é uma visão que calcula cada marcador sob
+    demanda em vez de uma lista de listas.
+    """
+
+    __slots__ = ("_attacked",)
+
+    def __init__(self, size=10):
+        super().__init__(size)
+        self._attacked = set()  # Índices das células atacadas
+
+    @property
+    def grid(self):
+        return _SparseGrid(self)
+
+    @property
+    def occupied_mask(self):
+        """
+        Bitmask das células ocupadas, só para áreas até MASK_AREA_LIMIT.
+
+        A bitmask tem um bit por célula do tabuleiro (cerca de 1,25 GB em
+        100k×100k); use ``occupied_cells``, proporcional aos navios.
+
+        Raises:
+            ValueError: Se a área passar de MASK_AREA_LIMIT
+        """
+        if self._size * self._size > MASK_AREA_LIMIT:
+            raise ValueError(
+                "Tabuleiro grande demais para bitmask; use occupied_cells"
+            )
+        mask = 0
+        for cell in self._cell_ships:
+            mask |= 1 << cell
+        return mask
+
+    @property
+    def attacks(self):
+        size = self._size
+        return {divmod(cell, size) for cell in self._attacked}
+
+    @property
+    def hits(self):
+        size = self._size
+        return {
+            divmod(cell, size) for cell in self._attacked if cell in self._cell_ships
+        }
+
+    def _marker(self, cell):
+        """Marcador do grid para uma célula"""
+        if cell in self._attacked:
+            return "X" if cell in self._cell_ships else "O"
+        return "N" if cell in self._cell_ships else "~"
+
+    def is_attacked(self, row, col):
+        """Verifica se uma posição já foi atacada"""
+        return row * self._size + col in self._attacked
+
+    def _is_occupied(self, cells):
+        """Verifica se alguma das células já pertence a um navio"""
+        return any(cell in self._cell_ships for cell in cells)
+
+    def _occupy(self, cells, ship):
+        """Marca as células como ocupadas pelo navio"""
+        for cell in cells:
+            self._cell_ships[cell] = ship
+
+    # Ataques serializados como lista de células, não bitmaps do tamanho da área
+    _BYTES_LAYOUT = _LAYOUT_CELL_LIST
+
+    def _pack_attacks(self, cell_fmt):
+        """Serializa os ataques como lista de células + bitmap de acertos"""
+        cells = sorted(self._attacked)
+        hits = 0
+        for i, cell in enumerate(cells):
+            if cell in self._cell_ships:
+                hits |= 1 << i
+        return struct.pack(
+            f"<{len(cells) + 1}{cell_fmt}", len(cells), *cells
+        ) + hits.to_bytes((len(cells) + 7) // 8, "little")
+
+    def _unmark_attack(self, cell, hit):
+        """Remove a marcação de ataque de uma célula"""
+        self._attacked.discard(cell)
+
+    def receive_attack(self, row, col):
+        """
+        Processa um ataque em uma posição.
+        Retorna: ('water', None) ou ('hit', ship) ou ('already_attacked', None)
+        """
+        if row < 0 or col < 0 or row >= self._size or col >= self._size:
+            raise ValueError("Ataque fora dos limites do tabuleiro")
+
+        cell = row * self._size + col
+
+        # Verifica se já foi atacado
+        if cell in self._attacked:
+            return ("already_attacked", None)
+
+        self._attacked.add(cell)
+        self._shot_count += 1
+
+        # Água
+        ship = self._cell_ships.get(cell)
+        if ship is None:
+            return ("water", None)
+
+        self._hit_count += 1
+        self._cells_remaining -= 1
+        ship.receive_attack((row, col))
+        if ship.is_destroyed():
+            self._ships_afloat -= 1
+        return ("hit", ship)
@@ -1,16 +1,27 @@
 """Classe Match - gerencia uma partida de batalha naval"""
 
+from model.entities.move_log import HistoryView, MoveLog
+
 
 class Match:
     """Gerencia uma partida entre dois jogadores"""
 
+    __slots__ = (
+        "_player1",
+        "_player2",
+        "_current_player",
+        "_turn",
+        "_winner",
+        "_history",
+    )
+
     def __init__(self, player1, player2):
         self._player1 = player1
         self._player2 = player2
         self._current_player = player1
         self._turn = 0
         self._winner = None
-        self._history = []  # Histórico da partida
+        self._history = MoveLog((player1.name, player2.name))  # Histórico da partida
 
     def switch_player(self):
         """Alterna entre jogador 1 e jogador 2"""
@@ -35,27 +46,18 @@ class Match:
         result, ship = opponent.board.receive_attack(row, col)
 
         # Registra no histórico
+        player_index = 0 if self._current_player is self._player1 else 1
         self._history.append(
-            {
-                "turn": self._turn,
-                "player": self._current_player.name,
-                "position": (row, col),
-                "result": result,
-            }
+            self._turn, player_index, row, col, opponent.board.size, result
         )
 
         # Verifica se o navio foi destruído
         ship_destroyed = ship.is_destroyed() if ship else False
-        print(
-            f"[Match] Após ataque em ({row},{col}): result={result}, ship_destroyed={ship_destroyed}"
-        )
 
         # Verifica fim de jogo
         game_over = opponent.has_lost()
-        print(f"[Match] game_over={game_over}")
         if game_over:
             self._winner = self._current_player
-            print(f"[Match] Vencedor: {self._winner.name}")
 
         return (result, ship_destroyed, game_over)
 
@@ -69,16 +71,22 @@ class Match:
         self._current_player = self._player1
 
     def get_status(self):
-        """Retorna informações sobre o estado atual da partida"""
+        """Retorna informações sobre o estado atual da partida.
+
+        Lê apenas os contadores incrementais dos tabuleiros, portanto é O(1)
+        e pode ser chamado a cada frame.
+        """
+        board1 = self._player1.board
+        board2 = self._player2.board
         return {
             "turn": self._turn,
             "current_player": self._current_player.name,
-            "ships_p1": len(
-                [s for s in self._player1.board.ships if not s.is_destroyed()]
-            ),
-            "ships_p2": len(
-                [s for s in self._player2.board.ships if not s.is_destroyed()]
-            ),
+            "ships_p1": board1.ships_remaining,
+            "ships_p2": board2.ships_remaining,
+            "shots_p1": board2.shot_count,
+            "hits_p1": board2.hit_count,
+            "shots_p2": board1.shot_count,
+            "hits_p2": board1.hit_count,
             "winner": self._winner.name if self._winner else None,
         }
 
@@ -108,6 +116,11 @@ class Match:
         return self._winner
 
     @property
-    def history(self) -> list:
-        """Obtém histórico do jogo."""
+    def history(self) -> HistoryView:
+        """Obtém histórico do jogo (visão list-of-dicts)."""
+        return self._history.history
+
+    @property
+    def move_log(self) -> MoveLog:
+        """Obtém histórico do jogo em arrays tipados."""
         return self._history
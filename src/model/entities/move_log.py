@@ -0,0 +1,121 @@
+"""Classe MoveLog - histórico compacto de jogadas de uma partida"""
+
+from array import array
+from collections.abc import Sequence
+
+from model.entities.board import RESULT_CODES, RESULTS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class HistoryView(Sequence):
+    """Visão somente leitura de um MoveLog no formato list-of-dicts.
+
+    Cada acesso monta o dicionário da jogada na hora; nada é guardado.
+    """
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log):
+        self._log = log
+
+    def __len__(self):
+        return len(self._log)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._log.move(i) for i in range(*index.indices(len(self._log)))]
+        if index < 0:
+            index += len(self._log)
+        if not 0 <= index < len(self._log):
+            raise IndexError("Índice de jogada fora do histórico")
+        return self._log.move(index)
+
+    def __eq__(self, other):
+        """Igual a qualquer sequência com as mesmas jogadas, como a lista antiga"""
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            move == other_move for move, other_move in zip(self, other)
+        )
+
+    __hash__ = None  # Mutável como a lista que substitui
+
+    def __repr__(self):
+        return f"HistoryView({len(self._log)} jogadas)"
+
+
+class MoveLog:
+    """Histórico de jogadas em arrays tipados paralelos.
+
+    Cada jogada ocupa 14 bytes (turno u32, índice do jogador u8, célula
+    atacada u64 e código do resultado u8), em vez de um dicionário por
+    jogada. ``history`` expõe o formato antigo de list-of-dicts sob demanda.
+    """
+
+    __slots__ = ("_player_names", "_widths", "_turns", "_players", "_cells", "_results")
+
+    def __init__(self, player_names):
+        self._player_names = tuple(player_names)
+        # Lado do tabuleiro atacado por cada jogador (para decodificar células)
+        self._widths = [0] * len(self._player_names)
+        self._turns = array("I")
+        self._players = array("B")
+        self._cells = array("Q")
+        self._results = array("B")
+
+    def __len__(self):
+        return len(self._turns)
+
+    @property
+    def history(self) -> HistoryView:
+        """Visão list-of-dicts (turn, player, position, result) do histórico."""
+        return HistoryView(self)
+
+    def append(self, turn, player_index, row, col, board_size, result):
+        """Registra uma jogada do jogador player_index em um tabuleiro de lado board_size"""
+        self._widths[player_index] = board_size
+        self._turns.append(turn)
+        self._players.append(player_index)
+        self._cells.append(row * board_size + col)
+        self._results.append(RESULT_CODES[result])
+
+    def move(self, index):
+        """Monta o dicionário de uma jogada"""
+        player = self._players[index]
+        return {
+            "turn": self._turns[index],
+            "player": self._player_names[player],
+            "position": divmod(self._cells[index], self._widths[player]),
+            "result": RESULTS[self._results[index]],
+        }
+
+    def iter_moves(self):
+        """Itera rapidamente sobre (turno, índice do jogador, célula, código do resultado)"""
+        return zip(self._turns, self._players, self._cells, self._results)
+
+    def to_numpy(self):
+        """
+        Exporta o histórico como array estruturado do NumPy com os campos
+        turn, player, cell e result.
+
+        Raises:
+            RuntimeError: Se o NumPy não estiver instalado
+        """
+        if np is None:
+            raise RuntimeError(
+                "numpy is not installed. Install with `pip install numpy`."
+            )
+
+        moves = np.empty(
+            len(self),
+            dtype=[("turn", "u4"), ("player", "u1"), ("cell", "u8"), ("result", "u1")],
+        )
+        moves["turn"] = np.frombuffer(self._turns, dtype=np.uint32)
+        moves["player"] = np.frombuffer(self._players, dtype=np.uint8)
+        moves["cell"] = np.frombuffer(self._cells, dtype=np.uint64)
+        moves["result"] = np.frombuffer(self._results, dtype=np.uint8)
+        return moves
@@ -8,9 +8,12 @@ from model.entities.board import Board
 class Player(ABC):
     """Classe base para jogadores (humano ou computador)"""
 
-    def __init__(self, name):
+    __slots__ = ("_name", "_board")
+
+    def __init__(self, name, board=None):
         self._name = name
-        self._board = Board()
+        # Qualquer variante de Board (ex.: SparseBoard) pode ser injetada
+        self._board = board if board is not None else Board()
 
     @abstractmethod
     def make_attack(self):
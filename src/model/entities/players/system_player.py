@@ -1,127 +1,259 @@
 """SystemPlayer - AI-controlled player (computer)"""
 
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from model.entities.player import Player
-from model.entities.ships import (
-    ArgylesVanShip,
-    ChristmasShip,
-    DemogorgonShip,
-    LaboratoryShip,
-    ScoopsAhoyShip,
+from model.ai import (
+    BookTargeting,
+    CachedTargeting,
+    create_strategy,
+    default_opening_book,
+    strategy_names,
 )
+from model.entities.player import Player
+from model.entities.ships import default_fleet
+from model.placement import place_fleet
 
 
 class SystemPlayer(Player):
-    """Computer-controlled player with simple AI"""
+    """Computer-controlled player with selectable AI difficulty
+
+    Difficulties, from weakest to strongest, each with a default per-move
+    compute budget (ms):
+    - "random": uniformly random unattacked cells
+    - "hunt_target": random shots, then the neighbours of the last hit
+    - "heatmap": probability-density targeting (requires NumPy)
+    - "monte_carlo": samples consistent enemy fleets on a process pool
+      until the deadline
+
+    The budget is a deadline only for anytime engines (Monte Carlo). For
+    the other tiers it is a nominal target: their moves always run to
+    completion, and the ones that take longer than the budget are counted
+    as overruns in get_latency_stats. The latency actually used is measured
+    on every move. The heatmap and Monte Carlo tiers open with the precomputed line
+    of the opening book (data/opening_book.bin), when it has one for the
+    board size and fleet, until the first hit. Their decisions are cached
+    in the shared transposition table, keyed by a Zobrist hash of the AI's
+    knowledge, so repeated positions skip the evaluation.
+    """
+
+    __slots__ = (
+        "_difficulty",
+        "_budget_ms",
+        "_use_opening_book",
+        "_use_transposition_table",
+        "_search_workers",
+        "_rng",
+        "_targeting",
+        "_move_executor",
+        "_last_latency_ms",
+        "_total_latency_ms",
+        "_max_latency_ms",
+        "_timed_moves",
+        "_overruns",
+    )
 
-    def __init__(self, name="Computer"):
-        super().__init__(name)
-        self._attacked_positions = set()
-        self._search_mode = False  # Active search mode after hit
-        self._last_hit = None
-        self._directions_to_test = []
+    DIFFICULTY_BUDGETS_MS = {
+        "random": 1,
+        "hunt_target": 1,
+        "heatmap": 20,
+        "monte_carlo": 100,
+    }
+    DIFFICULTIES = tuple(DIFFICULTY_BUDGETS_MS)
+
+    # Folga antes de contar uma jogada como estouro do prazo (ms): o Monte
+    # Carlo para no prazo e ainda gasta um pouco para juntar as amostras
+    OVERRUN_TOLERANCE_MS = 1.0
+
+    # Níveis que usam o opening book e a tabela de transposição
+    STRONG_DIFFICULTIES = ("heatmap", "monte_carlo")
+
+    def __init__(
+        self,
+        name="Computer",
+        board=None,
+        difficulty="hunt_target",
+        budget_ms=None,
+        use_opening_book=True,
+        use_transposition_table=True,
+        search_workers=None,
+        rng=None,
+    ):
+        """
+        Args:
+            name: Nome do jogador
+            board: Tabuleiro próprio (opcional)
+            difficulty: Nível da IA (ver DIFFICULTIES) ou outra estratégia
+                registrada com register_strategy
+            budget_ms: Prazo padrão por jogada (padrão: o do nível)
+            use_opening_book: Usa o opening book nos níveis heatmap e monte_carlo
+            use_transposition_table: Usa a tabela de transposição compartilhada
+                nos níveis heatmap e monte_carlo
+            search_workers: Processos da busca Monte Carlo (padrão: núcleos
+                da máquina; 0 = na própria thread)
+            rng: Gerador random.Random da frota e dos sorteios da IA
+                (padrão: módulo random)
+        """
+        super().__init__(name, board)
+        if difficulty not in strategy_names():
+            raise ValueError(f"Dificuldade desconhecida: {difficulty}")
+        self._difficulty = difficulty
+        # Estratégias registradas fora dos níveis usam o prazo do próprio motor
+        self._budget_ms = (
+            self.DIFFICULTY_BUDGETS_MS.get(difficulty) if budget_ms is None else budget_ms
+        )
+        self._use_opening_book = use_opening_book
+        self._use_transposition_table = use_transposition_table
+        self._search_workers = search_workers
+        self._rng = rng or random
+        if use_opening_book and difficulty in self.STRONG_DIFFICULTIES:
+            default_opening_book()  # Lê o livro agora, não na primeira jogada
+        self._targeting = None  # Targeting engine, created on first attack
+        self._move_executor = None  # Worker thread for async moves
+        self._last_latency_ms = 0.0
+        self._total_latency_ms = 0.0
+        self._max_latency_ms = 0.0
+        self._timed_moves = 0
+        self._overruns = 0
+
+    @property
+    def difficulty(self) -> str:
+        """Obtém dificuldade da IA."""
+        return self._difficulty
+
+    @property
+    def budget_ms(self) -> float:
+        """Obtém prazo padrão por jogada (ms)."""
+        return self._budget_ms
+
+    @property
+    def last_move_latency_ms(self) -> float:
+        """Tempo gasto na última jogada (ms)."""
+        return self._last_latency_ms
+
+    def get_latency_stats(self) -> dict:
+        """
+        Retorna o nível, o prazo e o tempo realmente gasto nas jogadas.
+
+        "overruns" conta as jogadas que passaram do prazo da própria jogada
+        por mais de OVERRUN_TOLERANCE_MS.
+        """
+        moves = self._timed_moves
+        return {
+            "difficulty": self._difficulty,
+            "budget_ms": self._budget_ms,
+            "moves": moves,
+            "last_ms": self._last_latency_ms,
+            "mean_ms": self._total_latency_ms / moves if moves else 0.0,
+            "max_ms": self._max_latency_ms,
+            "overruns": self._overruns,
+        }
 
     def place_ships(self):
         """Posiciona navios aleatoriamente no tabuleiro usando navios temáticos"""
-        default_ships = [
-            DemogorgonShip(),  # 5 cells
-            ScoopsAhoyShip(),  # 4 cells
-            ChristmasShip(),  # 3 cells
-            ArgylesVanShip(),  # 3 cells
-            LaboratoryShip(),  # 2 cells
-        ]
-
-        for ship in default_ships:
-            placed = False
-            attempts = 0
-            max_attempts = 100
-
-            while not placed and attempts < max_attempts:
-                row = random.randint(0, self._board.size - 1)
-                col = random.randint(0, self._board.size - 1)
-                horizontal = random.choice([True, False])
-
-                try:
-                    self._board.add_ship(ship, row, col, horizontal)
-                    placed = True
-                except ValueError:
-                    attempts += 1
-
-            if not placed:
-                print(
-                    f"Aviso: Não foi possível posicionar {ship.name} após {max_attempts} tentativas"
-                )
-
-    def make_attack(self):
+        try:
+            place_fleet(self._board, default_fleet(), self._rng)
+        except ValueError as e:
+            print(f"Aviso: Não foi possível posicionar a frota: {e}")
+
+    def make_attack(self, deadline_ms=None):
         """
         IA para escolher a próxima posição de ataque.
-        Usa estratégia simples: ataque aleatório até acertar, então busca ao redor.
+
+        Sem warm_up, a primeira jogada cria o motor (e inicia o pool do
+        Monte Carlo) antes de começar; esse tempo não conta no prazo nem na
+        latência medida.
+
+        Args:
+            deadline_ms: Prazo desta jogada (padrão: budget_ms); só o nível
+                monte_carlo para no prazo, os outros terminam a jogada
+
+        Returns:
+            Posição (linha, coluna) a atacar, ou None se não houver
+        """
+        budget = self._budget_ms if deadline_ms is None else deadline_ms
+        targeting = self._get_targeting()
+        start = time.perf_counter()
+        attack = targeting.next_attack(budget)
+
+        latency = (time.perf_counter() - start) * 1000
+        self._last_latency_ms = latency
+        self._total_latency_ms += latency
+        self._max_latency_ms = max(self._max_latency_ms, latency)
+        self._timed_moves += 1
+        if budget is not None and latency > budget + self.OVERRUN_TOLERANCE_MS:
+            self._overruns += 1
+        return attack
+
+    def make_attack_async(self, deadline_ms=None):
+        """
+        Calcula a próxima jogada em uma thread de trabalho.
+
+        Returns:
+            Future cujo resultado é a posição (linha, coluna) de make_attack
+        """
+        return self._get_move_executor().submit(self.make_attack, deadline_ms)
+
+    def warm_up(self):
         """
-        # If in search mode (hit a ship but didn't destroy it)
-        if self._search_mode and self._last_hit:
-            attack = self._smart_attack()
-            if attack:
-                return attack
-            else:
-                # If no more directions, return to random
-                self._search_mode = False
-
-        # Random attack
-        return self._random_attack()
-
-    def _random_attack(self):
-        """Escolhe uma posição aleatória que ainda não foi atacada"""
-        size = self._board.size  # Use own board size (same as opponent's)
-        available_positions = []
-
-        for row in range(size):
-            for col in range(size):
-                if (row, col) not in self._attacked_positions:
-                    available_positions.append((row, col))
-
-        if available_positions:
-            return random.choice(available_positions)
-        return None
-
-    def _smart_attack(self):
-        """Ataca posições adjacentes ao último acerto"""
-        if not self._last_hit:
-            return None
-
-        row, col = self._last_hit
-        size = self._board.size  # Use own board size (same as opponent's)
-
-        # Directions: up, down, left, right
-        directions = [
-            (row - 1, col),
-            (row + 1, col),
-            (row, col - 1),
-            (row, col + 1),
-        ]
-
-        # Filter valid and unattacked positions
-        valid_positions = [
-            (r, c)
-            for r, c in directions
-            if 0 <= r < size
-            and 0 <= c < size
-            and (r, c) not in self._attacked_positions
-        ]
-
-        if valid_positions:
-            return random.choice(valid_positions)
-        return None
-
-    def record_attack_result(self, position, result, ship_destroyed):
+        Cria o motor de mira na thread de trabalho, antes da primeira jogada.
+
+        Os recursos do motor (ex.: o pool de processos do Monte Carlo) são
+        iniciados nesse momento; as jogadas assíncronas seguintes esperam
+        por ele na mesma thread. Chame depois de posicionar os navios.
+
+        Returns:
+            Future concluído quando o motor estiver pronto
+        """
+        return self._get_move_executor().submit(self._get_targeting)
+
+    def _get_move_executor(self):
+        """Thread de trabalho única das jogadas assíncronas"""
+        if self._move_executor is None:
+            self._move_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="system-player"
+            )
+        return self._move_executor
+
+    def shutdown(self):
+        """Descarta jogadas pendentes e libera a thread de trabalho"""
+        if self._move_executor is not None:
+            self._move_executor.shutdown(wait=False, cancel_futures=True)
+            self._move_executor = None
+
+    def _get_targeting(self):
+        """Cria o motor de mira do nível; a frota adversária espelha a própria frota"""
+        if self._targeting is None:
+            size = self._board.size  # Use own board size (same as opponent's)
+            ship_sizes = [ship.size for ship in self._board.ships]
+            self._targeting = create_strategy(
+                self._difficulty,
+                size,
+                ship_sizes,
+                self._rng,
+                self._budget_ms,
+                workers=self._search_workers,
+            )
+            warm_up = getattr(self._targeting, "warm_up", None)
+            if warm_up is not None:
+                warm_up()  # Ex.: inicia o pool do Monte Carlo
+
+            strong = self._difficulty in self.STRONG_DIFFICULTIES
+            if strong and self._use_transposition_table:
+                self._targeting = CachedTargeting(self._targeting, size, ship_sizes)
+
+            book = default_opening_book() if self._use_opening_book else None
+            if book is not None and strong:
+                line = book.line(size, ship_sizes)
+                if line:
+                    self._targeting = BookTargeting(
+                        self._targeting, size, line, self._rng
+                    )
+        return self._targeting
+
+    def record_attack_result(self, position, result, ship_destroyed, ship_size=None):
         """Registra resultado do ataque para melhorar próximos movimentos"""
-        self._attacked_positions.add(position)
-
-        if result == "hit":
-            self._last_hit = position
-            if not ship_destroyed:
-                self._search_mode = True
-            else:
-                # Ship destroyed, return to random mode
-                self._search_mode = False
-                self._last_hit = None
+        self._get_targeting().record_attack_result(
+            position, result, ship_destroyed, ship_size
+        )
@@ -1,22 +1,34 @@
 """Classe Ship - representa um navio no jogo de batalha naval"""
 
-import pygame
-
 
 class Ship:
-    """Representa um navio com posição, tamanho e estado"""
+    """Representa um navio com posição, tamanho e estado.
+
+    É um objeto de dados puro: as imagens dos segmentos ficam no registro de
+    sprites da camada de view (view.ship_sprites), indexado por image_path.
+    A posição é guardada como célula inicial + orientação e os acertos como
+    um bitfield por segmento; ``positions`` e ``hits`` são calculados a
+    partir deles.
+    """
+
+    __slots__ = (
+        "_name",
+        "_size",
+        "_image_path",
+        "_row",
+        "_col",
+        "_horizontal",
+        "_hit_bits",
+    )
 
     def __init__(self, name, size, image_path=None):
         self._name = name
         self._size = size
-        self._positions = []  # Lista de tuplas (linha, coluna)
-        self._hits = set()  # Posições que foram atingidas
-        self._image_path = image_path
-        self._images = []  # Lista de superfícies pygame para cada segmento
+        self._image_path = image_path  # Prefixo dos arquivos de segmento
+        self._row = None  # Célula inicial (None enquanto não posicionado)
+        self._col = None
         self._horizontal = True  # Orientação padrão
-
-        if image_path:
-            self._load_images()
+        self._hit_bits = 0  # Bit i ligado = segmento i atingido
 
     # Propriedades de acesso
     @property
@@ -29,82 +41,81 @@ class Ship:
 
     @property
     def positions(self):
-        return self._positions
+        if self._row is None:
+            return []
+        if self._horizontal:
+            return [(self._row, self._col + i) for i in range(self._size)]
+        return [(self._row + i, self._col) for i in range(self._size)]
 
     @property
     def hits(self):
-        return self._hits
+        return {
+            position
+            for i, position in enumerate(self.positions)
+            if self._hit_bits >> i & 1
+        }
 
     @property
     def horizontal(self):
         return self._horizontal
 
-    def _load_images(self):
-        """Carrega imagens dos segmentos do navio"""
-        try:
-            # Carrega imagem para cada segmento do navio
-            for i in range(self._size):
-                segment_path = f"{self._image_path}_segment_{i + 1}.jpg"
-                try:
-                    img = pygame.image.load(segment_path)
-                    self._images.append(img)
-                except Exception:
-                    # Tenta imagem base
-                    try:
-                        img = pygame.image.load(f"{self._image_path}.jpg")
-                        self._images.append(img)
-                    except Exception:
-                        # Cria retângulo colorido como placeholder
-                        surf = pygame.Surface((40, 40))
-                        surf.fill((100, 100, 100))
-                        self._images.append(surf)
-                        print(
-                            f"Aviso: Não foi possível carregar segmento {i + 1} para {self._name}"
-                        )
-        except Exception as e:
-            print(f"Não foi possível carregar imagens para {self._name}: {e}")
+    @property
+    def image_path(self):
+        return self._image_path
 
     def place(self, positions):
-        """Posiciona o navio nas posições especificadas"""
+        """Posiciona o navio nas posições especificadas (em linha e contíguas)"""
         if len(positions) != self._size:
             raise ValueError(f"Navio {self._name} precisa de {self._size} posições")
-        self._positions = positions
 
         # Determina orientação baseada nas posições
+        horizontal = True
         if len(positions) >= 2:
-            self._horizontal = positions[0][0] == positions[1][0]
-
-    def get_image(self, segment_index, cell_size=40):
-        """Obtém imagem redimensionada para um segmento específico, rotacionada se vertical"""
-        if segment_index < len(self._images):
-            img = self._images[segment_index]
-            img = pygame.transform.scale(img, (cell_size, cell_size))
-
-            # Rotaciona -90 graus (270 graus) se o navio estiver vertical
-            if not self._horizontal:
-                img = pygame.transform.rotate(img, -90)
-
-            return img
-        return None
+            horizontal = positions[0][0] == positions[1][0]
+        row, col = min(positions)
+        self.place_at(row, col, horizontal)
+
+    def place_at(self, row, col, horizontal=True):
+        """Posiciona o navio a partir da célula inicial e da orientação"""
+        self._row = row
+        self._col = col
+        self._horizontal = horizontal
+        self._hit_bits = 0
+
+    def segment_index(self, position):
+        """Índice do segmento na posição, ou None se o navio não a ocupa"""
+        if self._row is None:
+            return None
+        row, col = position
+        if self._horizontal:
+            offset = col - self._col if row == self._row else -1
+        else:
+            offset = row - self._row if col == self._col else -1
+        return offset if 0 <= offset < self._size else None
+
+    def is_segment_hit(self, segment_index):
+        """Verifica se o segmento foi atingido"""
+        return bool(self._hit_bits >> segment_index & 1)
 
     def receive_attack(self, position):
         """Registra um ataque em uma posição. Retorna True se acertar"""
-        if position in self._positions:
-            self._hits.add(position)
-            print(
-                f"[Ship {self._name}] Hit at {position}! Hits: {len(self._hits)}/{self._size}"
-            )
-            return True
-        return False
+        segment = self.segment_index(position)
+        if segment is None:
+            return False
+        self._hit_bits |= 1 << segment
+        return True
+
+    def remove_hit(self, position):
+        """Desfaz o acerto em uma posição (usado por Board.undo_attack)"""
+        segment = self.segment_index(position)
+        if segment is not None:
+            self._hit_bits &= ~(1 << segment)
 
     def is_destroyed(self):
         """Verifica se o navio foi completamente destruído"""
-        destroyed = len(self._hits) == self._size
-        print(
-            f"[Ship {self._name}] is_destroyed called: {destroyed} (hits: {len(self._hits)}/{self._size})"
-        )
-        return destroyed
+        return self._hit_bits == (1 << self._size) - 1
 
     def __repr__(self):
         """Representação em string do navio para debug"""
-        return f"Ship({self._name}, size={self._size}, hits={len(self._hits)}/{self._size})"
+        hits = self._hit_bits.bit_count()
+        return f"Ship({self._name}, size={self._size}, hits={hits}/{self._size})"
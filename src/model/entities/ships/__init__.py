@@ -6,7 +6,25 @@ from .demogorgon_ship import DemogorgonShip
 from .laboratory_ship import LaboratoryShip
 from .scoops_ahoy_ship import ScoopsAhoyShip
 
+# Tipos de navio temáticos em ordem estável; o índice + 1 é o código de
+# tipo usado na serialização de tabuleiros (0 = Ship genérico)
+SHIP_TYPES = (
+    DemogorgonShip,
+    ScoopsAhoyShip,
+    ChristmasShip,
+    ArgylesVanShip,
+    LaboratoryShip,
+)
+
+
+def default_fleet():
+    """Nova frota padrão, com um navio de cada tipo temático"""
+    return [ship_type() for ship_type in SHIP_TYPES]
+
+
 __all__ = [
+    "SHIP_TYPES",
+    "default_fleet",
     "ArgylesVanShip",
     "ChristmasShip",
     "DemogorgonShip",
@@ -6,6 +6,8 @@ from model.entities.ship import Ship
 class ChristmasShip(Ship):
     """Navio temático baseado nas luzes de Natal de Stranger Things (3 células)"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="Christmas Lights", size=2, image_path="src/assets/ships/christmas"
@@ -6,6 +6,8 @@ from model.entities.ship import Ship
 class DemogorgonShip(Ship):
     """Navio temático baseado no Demogorgon (4 células - o maior)"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="Demogorgon", size=4, image_path="src/assets/ships/demogorgon"
@@ -6,6 +6,8 @@ from model.entities.ship import Ship
 class ScoopsAhoyShip(Ship):
     """Navio temático baseado na sorveteria Scoops Ahoy (4 células)"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="Scoops Ahoy", size=3, image_path="src/assets/ships/scoops_ahoy"
@@ -0,0 +1,15 @@
+"""Placement - enumeração e sorteio de posições de navios"""
+
+from .bulk import LayoutBatch, generate_layouts, iter_layouts
+from .placement_table import PlacementTable, placement_table
+from .sampler import place_fleet, sample_layout
+
+__all__ = [
+    "LayoutBatch",
+    "PlacementTable",
+    "generate_layouts",
+    "iter_layouts",
+    "place_fleet",
+    "placement_table",
+    "sample_layout",
+]
@@ -0,0 +1,186 @@
+"""Geração em massa de frotas com NumPy"""
+
+import random
+
+from model.entities.ships import default_fleet
+from model.placement.placement_table import placement_table
+from model.placement.sampler import sample_layout
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tamanhos da frota temática, na ordem de default_fleet()
+DEFAULT_FLEET = tuple(ship.size for ship in default_fleet())
+
+# Disposições por lote no modo streaming
+DEFAULT_BATCH_SIZE = 65_536
+
+# Candidatas sorteadas por sorteio, no máximo, em múltiplos do que falta
+MAX_OVERSAMPLING = 8
+
+# Taxa de aceitação mínima; abaixo dela o lote demoraria demais
+MIN_ACCEPTANCE = 1e-3
+
+# Candidatas sorteadas antes de julgar a taxa de aceitação
+ACCEPTANCE_PROBE = 4096
+
+
+class LayoutBatch:
+    """Lote de disposições de frota em arrays compactos.
+
+    Cada disposição é uma linha de ``placements``: o índice da posição de
+    cada navio na PlacementTable do seu tamanho (horizontais e depois
+    verticais, em ordem de linha). As outras visões são derivadas sob
+    demanda: início e orientação, células ocupadas e bitmask empacotada.
+    """
+
+    __slots__ = ("_size", "_lengths", "_placements")
+
+    def __init__(self, size, lengths, placements):
+        self._size = size
+        self._lengths = tuple(lengths)
+        self._placements = placements
+
+    def __len__(self):
+        return len(self._placements)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def lengths(self) -> tuple:
+        return self._lengths
+
+    @property
+    def placements(self):
+        """Array (N, navios) int32 de índices de posição."""
+        return self._placements
+
+    def starts(self):
+        """Arrays (N, navios) de linha, coluna e orientação (True = horizontal)"""
+        size = self._size
+        rows = np.empty(self._placements.shape, dtype=np.int32)
+        cols = np.empty(self._placements.shape, dtype=np.int32)
+        horizontal = np.empty(self._placements.shape, dtype=bool)
+        for ship, length in enumerate(self._lengths):
+            index = self._placements[:, ship]
+            span = size - length + 1
+            is_horizontal = index < size * span
+            vertical = index - size * span
+            rows[:, ship] = np.where(is_horizontal, index // span, vertical // size)
+            cols[:, ship] = np.where(is_horizontal, index % span, vertical % size)
+            horizontal[:, ship] = is_horizontal
+        return rows, cols, horizontal
+
+    def cells(self, ship):
+        """Array (N, tamanho) com as células ocupadas pelo navio ``ship``"""
+        table = placement_table(self._size, self._lengths[ship])
+        return table.cells[self._placements[:, ship]]
+
+    def occupancy(self):
+        """Array (N, size * size) bool das células ocupadas"""
+        n_cells = self._size * self._size
+        occupied = np.zeros((len(self), n_cells), dtype=bool)
+        rows = np.arange(len(self))[:, None]
+        for ship in range(len(self._lengths)):
+            occupied[rows, self.cells(ship)] = True
+        return occupied
+
+    def packed(self):
+        """Array (N, ceil(size * size / 8)) uint8 com a ocupação em bits"""
+        return np.packbits(self.occupancy(), axis=1, bitorder="little")
+
+    def masks(self):
+        """Bitmasks de ocupação como ints Python (bit ``row * size + col``)"""
+        for row in self.packed():
+            yield int.from_bytes(row.tobytes(), "little")
+
+
+def _sample_batch(rng, size, lengths, count):
+    """Sorteia ``count`` frotas candidatas e mantém as sem sobreposição"""
+    placements = np.empty((count, len(lengths)), dtype=np.int32)
+    cells = []
+    for ship, length in enumerate(lengths):
+        table = placement_table(size, length)
+        index = rng.integers(0, len(table), size=count)
+        placements[:, ship] = index
+        cells.append(table.cells[index])
+
+    # Sobreposição = célula repetida na linha ordenada
+    cells = np.sort(np.concatenate(cells, axis=1), axis=1)
+    valid = ~(cells[:, 1:] == cells[:, :-1]).any(axis=1)
+    return placements[valid]
+
+
+def iter_layouts(
+    n=None, size=10, lengths=DEFAULT_FLEET, seed=None, batch_size=DEFAULT_BATCH_SIZE
+):
+    """
+    Gera disposições uniformes de frota em lotes (modo streaming).
+
+    Cada navio é sorteado entre todas as suas posições e as frotas com
+    sobreposição são descartadas, então as disposições válidas são
+    equiprováveis. Só um lote fica em memória por vez e cada sorteio gera
+    no máximo MAX_OVERSAMPLING vezes as disposições que faltam. Para frotas
+    que quase lotam o tabuleiro a aceitação cai abaixo de MIN_ACCEPTANCE e
+    a geração é interrompida; nesses casos use sample_layout.
+
+    Args:
+        n: Total de disposições (None = sem fim)
+        size: Lado do tabuleiro
+        lengths: Tamanhos dos navios
+        seed: Semente do gerador NumPy (mesma semente e lote = mesma sequência)
+        batch_size: Disposições por lote
+
+    Yields:
+        LayoutBatch com até ``batch_size`` disposições
+
+    Raises:
+        RuntimeError: Se o NumPy não estiver instalado
+        ValueError: Se a frota não couber no tabuleiro ou se a taxa de
+            aceitação ficar abaixo de MIN_ACCEPTANCE
+    """
+    if np is None:
+        raise RuntimeError(
+            "numpy is not installed. Install with `pip install numpy`."
+        )
+    lengths = tuple(lengths)
+    # Garante que a frota cabe antes de sortear (busca limitada de sample_layout)
+    sample_layout(size, lengths, random.Random(seed))
+
+    rng = np.random.default_rng(seed)
+    drawn = kept = 0  # Candidatas sorteadas e aceitas, para estimar a aceitação
+    remaining = n
+    while remaining is None or remaining > 0:
+        wanted = batch_size if remaining is None else min(batch_size, remaining)
+        parts = []
+        found = 0
+        while found < wanted:
+            if drawn >= ACCEPTANCE_PROBE and kept < MIN_ACCEPTANCE * drawn:
+                raise ValueError(
+                    "Taxa de aceitação baixa demais para a geração em massa; "
+                    "use sample_layout"
+                )
+            missing = wanted - found
+            acceptance = max(kept, 1) / drawn if drawn else 0.5
+            count = min(int(missing / acceptance * 1.1) + 16, MAX_OVERSAMPLING * missing)
+            accepted = _sample_batch(rng, size, lengths, count)
+            drawn += count
+            kept += len(accepted)
+            parts.append(accepted)
+            found += len(accepted)
+        placements = np.concatenate(parts)[:wanted]
+        if remaining is not None:
+            remaining -= wanted
+        yield LayoutBatch(size, lengths, placements)
+
+
+def generate_layouts(n, size=10, lengths=DEFAULT_FLEET, seed=None):
+    """Gera ``n`` disposições uniformes de frota em um único LayoutBatch"""
+    parts = [batch.placements for batch in iter_layouts(n, size, lengths, seed)]
+    if not parts:
+        return LayoutBatch(size, lengths, np.empty((0, len(lengths)), dtype=np.int32))
+    return LayoutBatch(size, lengths, np.concatenate(parts))
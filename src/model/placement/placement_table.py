@@ -0,0 +1,134 @@
+"""PlacementTable - todas as posições legais de um navio em um tabuleiro vazio"""
+
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Número de tabelas (tamanho do tabuleiro, tamanho do navio) mantidas em cache
+TABLE_CACHE_SIZE = 64
+
+
+class PlacementTable:
+    """Posições de um navio de tamanho ``length`` em um tabuleiro ``size``×``size``.
+
+    As posições são numeradas de forma estável: primeiro as horizontais e
+    depois as verticais, cada grupo em ordem de linha da célula inicial.
+    Cada posição tem uma bitmask no mesmo formato de Board (bit
+    ``row * size + col``). As visões (bitmasks, células em NumPy e índice
+    célula -> posições) são montadas na primeira vez que são pedidas.
+    Use placement_table() para obter instâncias compartilhadas.
+    """
+
+    __slots__ = ("_size", "_length", "_starts", "_masks", "_cells", "_covering")
+
+    def __init__(self, size, length):
+        self._size = size
+        self._length = length
+        self._masks = None
+        self._cells = None
+        self._covering = None
+
+        span = size - length + 1
+        if length < 1 or span < 1:
+            self._starts = ()
+        else:
+            horizontal = [
+                (row, col, True) for row in range(size) for col in range(span)
+            ]
+            vertical = [
+                (row, col, False) for row in range(span) for col in range(size)
+            ]
+            self._starts = tuple(horizontal + vertical)
+
+    def __len__(self):
+        return len(self._starts)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def starts(self) -> tuple:
+        """Tupla de (linha, coluna, horizontal) de cada posição."""
+        return self._starts
+
+    @property
+    def masks(self) -> tuple:
+        """Bitmask das células de cada posição."""
+        if self._masks is None:
+            size = self._size
+            length = self._length
+            row_mask = (1 << length) - 1
+            col_mask = 0
+            for i in range(length):
+                col_mask |= 1 << (i * size)
+            self._masks = tuple(
+                (row_mask if horizontal else col_mask) << (row * size + col)
+                for row, col, horizontal in self._starts
+            )
+        return self._masks
+
+    @property
+    def cells(self):
+        """Array NumPy (P, length) com os índices das células de cada posição."""
+        if self._cells is None:
+            if np is None:
+                raise RuntimeError(
+                    "numpy is not installed. Install with `pip install numpy`."
+                )
+            size = self._size
+            starts = np.array(self._starts, dtype=np.intp).reshape(-1, 3)
+            first = starts[:, 0] * size + starts[:, 1]
+            step = np.where(starts[:, 2] == 1, 1, size)
+            self._cells = first[:, None] + step[:, None] * np.arange(self._length)
+            self._cells.setflags(write=False)  # Compartilhado entre usuários da tabela
+        return self._cells
+
+    @property
+    def covering(self):
+        """Índice CSR (indptr, posições): posições que cobrem cada célula.
+
+        As posições que cobrem a célula ``c`` são
+        ``posições[indptr[c]:indptr[c + 1]]``.
+        """
+        if self._covering is None:
+            cells = self.cells
+            n_cells = self._size * self._size
+            flat = cells.ravel()
+            order = np.argsort(flat, kind="stable")
+            indptr = np.zeros(n_cells + 1, dtype=np.intp)
+            np.cumsum(np.bincount(flat, minlength=n_cells), out=indptr[1:])
+            placements = order // max(self._length, 1)
+            indptr.setflags(write=False)
+            placements.setflags(write=False)
+            self._covering = (indptr, placements)
+        return self._covering
+
+    def index_of(self, row, col, horizontal):
+        """Índice da posição com início em (row, col) e a orientação dada"""
+        size = self._size
+        span = size - self._length + 1
+        if horizontal:
+            if not (0 <= row < size and 0 <= col < span):
+                raise ValueError("Navio fora dos limites do tabuleiro")
+            return row * span + col
+        if not (0 <= row < span and 0 <= col < size):
+            raise ValueError("Navio fora dos limites do tabuleiro")
+        return size * span + row * size + col
+
+    def legal(self, occupied_mask):
+        """Índices das posições que não colidem com as células ocupadas"""
+        return [i for i, mask in enumerate(self.masks) if not mask & occupied_mask]
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def placement_table(size, length):
+    """Tabela compartilhada (com cache LRU limitado) para um tabuleiro e tamanho de navio"""
+    return PlacementTable(size, length)
@@ -0,0 +1,363 @@
+"""Sorteio de frotas - posições uniformes entre as disposições válidas"""
+
+import random
+from collections import Counter
+
+from model.entities.boards import SparseBoard
+from model.entities.boards.sparse_board import MASK_AREA_LIMIT
+
+# Acima de MASK_AREA_LIMIT (o mesmo de SparseBoard.occupied_mask) as colisões
+# são verificadas em conjuntos de células, sem bitmasks do tamanho do tabuleiro
+
+# Rodadas de rejeição da frota inteira por tentativa (ver _exact_layout)
+MAX_REJECTION_ROUNDS = 2000
+
+# Estados da contagem exata avaliados entre rodadas de rejeição
+COUNT_STEPS = 2000
+
+# Sorteios por navio até achar uma posição livre de células ocupadas
+MAX_SHIP_DRAWS = 64
+
+
+
+def _placement(size, length, index):
+    """(linha, coluna, horizontal, bitmask) da posição ``index`` de PlacementTable"""
+    span = size - length + 1
+    horizontal_count = size * span
+    if index < horizontal_count:
+        row, col = divmod(index, span)
+        return row, col, True, ((1 << length) - 1) << (row * size + col)
+    row, col = divmod(index - horizontal_count, size)
+    mask = 0
+    for i in range(length):
+        mask |= 1 << ((row + i) * size + col)
+    return row, col, False, mask
+
+
+def _placement_cells(size, length, index):
+    """(linha, coluna, horizontal, células) da posição ``index``, sem bitmask"""
+    span = size - length + 1
+    horizontal_count = size * span
+    if index < horizontal_count:
+        row, col = divmod(index, span)
+        start = row * size + col
+        return row, col, True, range(start, start + length)
+    row, col = divmod(index - horizontal_count, size)
+    start = row * size + col
+    return row, col, False, range(start, start + length * size, size)
+
+
+def _draw_free(size, length, rng, occupied):
+    """Posição uniforme entre as que não tocam ``occupied``, ou None se demorar"""
+    count = 2 * size * (size - length + 1)
+    for _ in range(MAX_SHIP_DRAWS):
+        placement = _placement(size, length, rng.randrange(count))
+        if not placement[3] & occupied:
+            return placement
+    return None
+
+
+def _rejection_layout(size, lengths, rng, occupied):
+    """
+    Sorteia cada navio uniformemente entre suas posições livres e aceita a
+    frota só se os navios não se sobrepõem. Cada disposição válida tem a
+    mesma probabilidade. Retorna None se as rodadas se esgotarem.
+    """
+    for _ in range(MAX_REJECTION_ROUNDS):
+        layout = []
+        used = occupied
+        for length in lengths:
+            placement = _draw_free(size, length, rng, occupied)
+            if placement is None:
+                return None
+            if placement[3] & used:
+                break
+            used |= placement[3]
+            layout.append(placement[:3])
+        else:
+            return layout
+    return None
+
+
+def _rejection_layout_cells(size, lengths, rng, occupied_cells):
+    """Mesma rejeição de _rejection_layout com conjuntos de células ocupadas"""
+    for _ in range(MAX_REJECTION_ROUNDS):
+        layout = []
+        used = set()
+        for length in lengths:
+            count = 2 * size * (size - length + 1)
+            for _ in range(MAX_SHIP_DRAWS):
+                row, col, horizontal, cells = _placement_cells(
+                    size, length, rng.randrange(count)
+                )
+                if not any(cell in occupied_cells for cell in cells):
+                    break
+            else:
+                return None
+            if any(cell in used for cell in cells):
+                break
+            used.update(cells)
+            layout.append((row, col, horizontal))
+        else:
+            return layout
+    return None
+
+
+def _fleet_groups(lengths):
+    """(tamanho, navios) de cada tamanho da frota, do maior para o menor"""
+    return tuple(sorted(Counter(lengths).items(), reverse=True))
+
+
+class _LayoutCounter:
+    """Conta e sorteia disposições de uma frota pela fronteira em ordem de linha.
+
+    As células são decididas em ordem de linha: a menor célula ainda livre
+    recebe um navio que começa nela ou fica vazia. O estado da busca é a
+    célula atual, as células já ocupadas dali em diante (a fronteira, de no
+    máximo um navio vertical de altura) e os navios que faltam de cada
+    tamanho. O número de disposições que completam cada estado é memorizado,
+    e o sorteio escolhe cada ramo com probabilidade proporcional a ele: cada
+    disposição sai com a mesma probabilidade, e a contagem só dá zero quando
+    a frota não cabe. A contagem pode ser feita em etapas (ver count).
+    """
+
+    __slots__ = ("_size", "_area", "_groups", "_shapes", "_counts", "_stack", "start")
+
+    def __init__(self, size, groups, occupied):
+        self._size = size
+        self._area = size * size
+        self._groups = groups
+        self._shapes = tuple(
+            (
+                length,
+                (1 << length) - 1,
+                sum(1 << (i * size) for i in range(length)) if length > 1 else 0,
+            )
+            for length, _ in groups
+        )
+        self._counts = {}
+        self.start = self._advance(0, occupied, tuple(count for _, count in groups))
+        self._stack = [self.start]
+
+    @staticmethod
+    def _advance(cell, frontier, remaining):
+        """Estado na próxima célula livre a partir de ``cell``"""
+        skip = (~frontier & (frontier + 1)).bit_length() - 1
+        return cell + skip, frontier >> skip, remaining
+
+    def _children(self, state):
+        """Pares (posição ou None, estado seguinte) de cada ramo do estado"""
+        cell, frontier, remaining = state
+        size = self._size
+        advance = self._advance
+        row, col = divmod(cell, size)
+        children = []
+        for group, (length, horizontal, vertical) in enumerate(self._shapes):
+            if not remaining[group]:
+                continue
+            left = remaining[:group] + (remaining[group] - 1,) + remaining[group + 1 :]
+            if col + length <= size and not frontier & horizontal:
+                children.append(
+                    ((group, row, col, True), advance(cell, frontier | horizontal, left))
+                )
+            if vertical and row + length <= size and not frontier & vertical:
+                children.append(
+                    ((group, row, col, False), advance(cell, frontier | vertical, left))
+                )
+        children.append((None, advance(cell, frontier | 1, remaining)))
+        return children
+
+    def _leaf(self, state):
+        """Contagem de um estado resolvido sem ramificar, ou None"""
+        cell, frontier, remaining = state
+        if not any(remaining):
+            return 1
+        needed = sum(shape[0] * count for shape, count in zip(self._shapes, remaining))
+        if needed > self._area - cell - frontier.bit_count():
+            return 0
+        return None
+
+    def count(self, steps=None):
+        """
+        Número de disposições da frota.
+
+        Args:
+            steps: Estados a avaliar nesta chamada (padrão: até terminar)
+
+        Returns:
+            O número de disposições, ou None se ``steps`` acabou antes; a
+            próxima chamada continua de onde esta parou
+        """
+        counts = self._counts
+        stack = self._stack
+        while stack:
+            if steps is not None:
+                if steps <= 0:
+                    return None
+                steps -= 1
+            current = stack[-1]
+            if current in counts:
+                stack.pop()
+                continue
+            leaf = self._leaf(current)
+            if leaf is not None:
+                counts[current] = leaf
+                stack.pop()
+                continue
+            children = [child for _, child in self._children(current)]
+            missing = [child for child in children if child not in counts]
+            if missing:
+                stack.extend(missing)
+                continue
+            counts[current] = sum(counts[child] for child in children)
+            stack.pop()
+        return counts[self.start]
+
+    def sample(self, rng):
+        """
+        Sorteia uma disposição uniforme (a contagem deve estar completa).
+
+        Returns:
+            Posições (linha, coluna, horizontal) de cada grupo de tamanho
+
+        Raises:
+            ValueError: Se nenhuma disposição couber
+        """
+        if not self.count():
+            raise ValueError("Não há espaço para posicionar a frota")
+        counts = self._counts
+        chosen = [[] for _ in self._groups]
+        state = self.start
+        while any(state[2]):
+            pick = rng.randrange(counts[state])
+            for placement, child in self._children(state):
+                weight = counts[child]
+                if pick < weight:
+                    break
+                pick -= weight
+            if placement is not None:
+                chosen[placement[0]].append(placement[1:])
+            state = child
+        return chosen
+
+
+# Contador da última frota que chegou à busca exata (por processo)
+_counter_cache = {}
+
+
+def _exact_layout(size, lengths, rng, occupied):
+    """
+    Sorteia uma disposição uniforme em um tabuleiro lotado.
+
+    Alterna etapas de COUNT_STEPS estados da contagem exata (_LayoutCounter)
+    com rodadas de rejeição, e usa o que terminar primeiro. As duas são
+    uniformes, e a disposição aceita pela rejeição não depende de quantas
+    rodadas ela levou, então o resultado continua uniforme. A rejeição
+    resolve rápido os tabuleiros com folga, que têm muitos estados; a
+    contagem, os quase cheios, em que a rejeição quase nunca aceita.
+
+    Raises:
+        ValueError: Se a frota não couber
+    """
+    groups = _fleet_groups(lengths)
+    key = (size, groups, occupied)
+    counter = _counter_cache.get(key)
+    if counter is None:
+        counter = _LayoutCounter(size, groups, occupied)
+        _counter_cache.clear()
+        _counter_cache[key] = counter
+
+    while counter.count(COUNT_STEPS) is None:
+        layout = _rejection_layout(size, lengths, rng, occupied)
+        if layout is not None:
+            return layout
+
+    layout = [None] * len(lengths)
+    for (length, _), placements in zip(groups, counter.sample(rng)):
+        ships = [i for i, ship_length in enumerate(lengths) if ship_length == length]
+        rng.shuffle(ships)
+        for ship, placement in zip(ships, placements):
+            layout[ship] = placement
+    return layout
+
+
+def sample_layout(size, lengths, rng=None, occupied=0, occupied_cells=None):
+    """
+    Sorteia posições para uma frota.
+
+    Tenta primeiro a rejeição da frota inteira, que é exatamente uniforme e
+    rápida em tabuleiros com espaço. Em tabuleiros lotados alterna a
+    rejeição com a contagem exata das disposições (ver _exact_layout),
+    também uniforme, que só falha se a frota não couber.
+
+    Com ``occupied_cells`` (ou em tabuleiros com área acima de
+    MASK_AREA_LIMIT) a rejeição verifica colisões em conjuntos de células,
+    com memória proporcional aos navios. A contagem exata, que usa
+    bitmasks, só é tentada se a área não passar de MASK_AREA_LIMIT.
+
+    Args:
+        size: Lado do tabuleiro
+        lengths: Tamanhos dos navios
+        rng: Gerador random.Random (padrão: módulo random)
+        occupied: Bitmask de células já ocupadas (bit ``row * size + col``)
+        occupied_cells: Conjunto de índices de células já ocupadas (substitui
+            ``occupied``)
+
+    Returns:
+        Lista de (linha, coluna, horizontal), na ordem de ``lengths``
+
+    Raises:
+        ValueError: Se a frota não couber no tabuleiro, ou se a rejeição
+            falhar em um tabuleiro com área acima de MASK_AREA_LIMIT
+    """
+    rng = rng or random
+    lengths = list(lengths)
+    if any(length < 1 or length > size for length in lengths):
+        raise ValueError("Navio maior que o tabuleiro")
+
+    if occupied_cells is not None or size * size > MASK_AREA_LIMIT:
+        occupied_cells = occupied_cells if occupied_cells is not None else set()
+        if sum(lengths) > size * size - len(occupied_cells):
+            raise ValueError("Não há espaço para posicionar a frota")
+        layout = _rejection_layout_cells(size, lengths, rng, occupied_cells)
+        if layout is not None:
+            return layout
+        if size * size > MASK_AREA_LIMIT:
+            raise ValueError(
+                "Não foi possível encontrar uma disposição para a frota "
+                "dentro do limite de sorteios"
+            )
+        # Tabuleiro pequeno e lotado: a bitmask é barata para a contagem exata
+        occupied = 0
+        for cell in occupied_cells:
+            occupied |= 1 << cell
+        return _exact_layout(size, lengths, rng, occupied)
+
+    if sum(lengths) > size * size - occupied.bit_count():
+        raise ValueError("Não há espaço para posicionar a frota")
+
+    layout = _rejection_layout(size, lengths, rng, occupied)
+    if layout is not None:
+        return layout
+    return _exact_layout(size, lengths, rng, occupied)
+
+
+def place_fleet(board, ships, rng=None):
+    """
+    Posiciona os navios no tabuleiro com sample_layout.
+
+    Em SparseBoard, ou em tabuleiros com área acima de MASK_AREA_LIMIT, as
+    células ocupadas são passadas como conjunto, sem montar a bitmask.
+
+    Raises:
+        ValueError: Se nenhuma disposição da frota couber no tabuleiro
+    """
+    lengths = [ship.size for ship in ships]
+    if isinstance(board, SparseBoard) or board.size * board.size > MASK_AREA_LIMIT:
+        layout = sample_layout(
+            board.size, lengths, rng, occupied_cells=board.occupied_cells
+        )
+    else:
+        layout = sample_layout(board.size, lengths, rng, board.occupied_mask)
+    for ship, (row, col, horizontal) in zip(ships, layout):
+        board.add_ship(ship, row, col, horizontal)
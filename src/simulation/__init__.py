@@ -0,0 +1,18 @@
+"""Simulação sem interface de partidas IA x IA"""
+
+from .parallel import ResultSink, run_parallel
+from .runner import (
+    SimulationStats,
+    format_summary,
+    game_seed,
+    play_match,
+)
+
+__all__ = [
+    "ResultSink",
+    "SimulationStats",
+    "format_summary",
+    "game_seed",
+    "play_match",
+    "run_parallel",
+]
@@ -0,0 +1,6 @@
+"""Ponto de entrada: python -m simulation"""
+
+from simulation.parallel import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Simulação paralela - partidas IA x IA em um pool de processos
+
+As partidas são divididas em shards de números consecutivos e distribuídas
+pelo pool de processos de self_play.run_tasks, o mesmo do torneio. A
+semente de cada partida vem só da semente da simulação e do número da
+partida (game_seed), e a tabela de transposição
+fica desligada por padrão, então uma partida não depende das outras que o
+mesmo processo jogou: o resultado é o mesmo com qualquer número de workers
+ou tamanho de shard, e --replay GAME repete a partida. O Monte Carlo é a
+exceção: limitado por prazo, o número de amostras varia entre execuções.
+Com --cache os níveis fortes reaproveitam decisões de partidas anteriores do
+processo e essas garantias deixam de valer.
+
+Os resultados são gravados em um arquivo JSONL ou CSV aberto em modo append
+à medida que os shards terminam (fora de ordem; a coluna "game" identifica
+a partida). Só um número limitado de shards fica em andamento e as
+estatísticas são agregadas em contadores, então a memória do processo
+principal não cresce com o número de partidas. Cada worker guarda o opening
+book e, com --cache, uma tabela de transposição limitada a
+transposition.DEFAULT_CAPACITY jogadas.
+
+Uso (a partir da raiz do projeto):
+    PYTHONPATH=src python -m simulation --games 1000000 --output results.jsonl
+"""
+
+import csv
+import json
+import os
+import time
+
+from model.ai import shutdown_pool
+from model.ai.self_play import run_tasks
+from simulation.runner import (
+    SIDES,
+    SimulationStats,
+    build_parser,
+    format_summary,
+    play_match,
+    simulation_options,
+)
+
+# Partidas por tarefa enviada ao pool
+DEFAULT_SHARD_SIZE = 200
+
+# Colunas do arquivo de resultados (listas de play_match viram uma por lado)
+FIELDS = (
+    "game",
+    "seed",
+    "first",
+    "winner",
+    "turns",
+    "shots_p1",
+    "shots_p2",
+    "hits_p1",
+    "hits_p2",
+    "moves_p1",
+    "moves_p2",
+    "latency_ms_p1",
+    "latency_ms_p2",
+    "max_latency_ms_p1",
+    "max_latency_ms_p2",
+    "elapsed_ms",
+)
+
+
+def flatten_record(record):
+    """Resultado de play_match como dicionário plano, na ordem de FIELDS"""
+    row = {}
+    for field in FIELDS:
+        key, _, side = field.rpartition("_")
+        if side in SIDES:
+            row[field] = record[key][SIDES.index(side)]
+        else:
+            row[field] = record[field]
+    return row
+
+
+class ResultSink:
+    """Arquivo de resultados só de acréscimo, em JSONL ou CSV.
+
+    Cada partida vira uma linha. O formato vem da extensão do arquivo
+    (".csv" = CSV, senão JSONL) ou de ``fmt``. No CSV o cabeçalho só é
+    escrito se o arquivo estiver vazio, então execuções podem ser somadas ao
+    mesmo arquivo.
+    """
+
+    __slots__ = ("_file", "_format", "_writer", "_count")
+
+    FORMATS = ("jsonl", "csv")
+
+    def __init__(self, path, fmt=None):
+        """
+        Args:
+            path: Caminho do arquivo (criado se não existir)
+            fmt: "jsonl" ou "csv" (padrão: pela extensão)
+
+        Raises:
+            ValueError: Se o formato for desconhecido
+        """
+        if fmt is None:
+            fmt = "csv" if str(path).lower().endswith(".csv") else "jsonl"
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Formato desconhecido: {fmt}")
+        self._format = fmt
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._writer = None
+        self._count = 0
+        if fmt == "csv":
+            self._writer = csv.DictWriter(self._file, fieldnames=FIELDS)
+            if self._file.tell() == 0:
+                self._writer.writeheader()
+
+    @property
+    def count(self) -> int:
+        """Partidas gravadas por este sink."""
+        return self._count
+
+    def write(self, records):
+        """Acrescenta os resultados de play_match e descarrega o buffer"""
+        for record in records:
+            row = flatten_record(record)
+            if self._writer is not None:
+                self._writer.writerow(row)
+            else:
+                self._file.write(json.dumps(row, separators=(",", ":")) + "\n")
+            self._count += 1
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _play_shard(start, stop, seed, options):
+    """Joga as partidas [start, stop) (executado nos workers)"""
+    return [play_match(game, seed, **options) for game in range(start, stop)]
+
+
+def _shards(games, shard_size):
+    """Intervalos (início, fim) de números de partida, gerados sob demanda"""
+    for start in range(0, games, shard_size):
+        yield start, min(start + shard_size, games)
+
+
+def run_parallel(
+    games=1000,
+    seed=0,
+    workers=None,
+    shard_size=DEFAULT_SHARD_SIZE,
+    sink=None,
+    **options,
+):
+    """
+    Joga ``games`` partidas em um pool de processos.
+
+    Args:
+        games: Número de partidas
+        seed: Semente da simulação
+        workers: Processos do pool (padrão: núcleos da máquina; 0 = sem pool)
+        shard_size: Partidas por tarefa
+        sink: ResultSink que recebe cada shard ao terminar (opcional)
+        **options: Repassadas a play_match (difficulties, size, fleet, ...)
+
+    Returns:
+        Resumo de SimulationStats com "elapsed_s" e "games_per_s"
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    # Workers já dividem os núcleos: a busca Monte Carlo roda sem pool próprio
+    options.setdefault("search_workers", 0 if workers > 0 else None)
+    stats = SimulationStats()
+
+    shards = (
+        (start, stop, seed, options)
+        for start, stop in _shards(games, max(1, shard_size))
+    )
+    started = time.perf_counter()
+    for records in run_tasks(_play_shard, shards, workers):
+        for record in records:
+            stats.add(record)
+        if sink is not None:
+            sink.write(records)
+    elapsed = time.perf_counter() - started
+
+    summary = stats.summary()
+    summary["elapsed_s"] = elapsed
+    summary["games_per_s"] = games / elapsed if elapsed > 0 else 0.0
+    return summary
+
+
+def main(argv=None):
+    parser = build_parser()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processos do pool (padrão: núcleos da máquina; 0 = sem pool)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="Partidas por tarefa do pool",
+    )
+    parser.add_argument(
+        "--output", default=None, help="Arquivo de resultados (.jsonl ou .csv)"
+    )
+    parser.add_argument("--format", choices=ResultSink.FORMATS, default=None)
+    parser.add_argument(
+        "--replay",
+        type=int,
+        default=None,
+        metavar="GAME",
+        help="Joga só a partida de número GAME e mostra o resultado",
+    )
+    args = parser.parse_args(argv)
+    options = simulation_options(args, parser)
+
+    try:
+        if args.replay is not None:
+            record = play_match(args.replay, args.seed, **options)
+            print(json.dumps(flatten_record(record), indent=2))
+            return
+
+        sink = ResultSink(args.output, args.format) if args.output else None
+        try:
+            summary = run_parallel(
+                args.games, args.seed, args.workers, args.shard_size, sink, **options
+            )
+        finally:
+            if sink is not None:
+                sink.close()
+            shutdown_pool()  # Pool do Monte Carlo usado com --workers 0
+    except ValueError as e:
+        parser.error(str(e))
+    except RuntimeError as e:
+        parser.error(str(e))  # NumPy ausente (níveis que usam HeatmapTargeting)
+    print(format_summary(summary, options["difficulties"]))
@@ -0,0 +1,251 @@
+"""Simulação sem interface - partidas IA x IA pelo Match e SystemPlayer
+
+Joga N partidas completas pelo mesmo caminho da GUI (Match.process_turn,
+SystemPlayer.make_attack e record_attack_result), sem pygame. Cada partida
+tem uma semente derivada da semente da simulação e do seu número. A linha
+de comando e o pool de processos ficam em simulation.parallel.
+
+Uso (a partir da raiz do projeto):
+    PYTHONPATH=src python -m simulation --games 1000 --p1 heatmap --p2 hunt_target
+"""
+
+import argparse
+import time
+
+from model.ai.self_play import LatencyStats, game_seed, play_game
+from model.entities.players.system_player import SystemPlayer
+
+SIDES = ("p1", "p2")
+
+
+def parse_fleet(text):
+    """Converte "4,3,3,3,2" em uma tupla de tamanhos de navio"""
+    try:
+        lengths = tuple(int(part) for part in text.split(",") if part.strip())
+    except ValueError:
+        raise ValueError(f"Frota inválida: {text}") from None
+    if not lengths or min(lengths) < 1:
+        raise ValueError(f"Frota inválida: {text}")
+    return lengths
+
+
+def play_match(
+    game,
+    seed=0,
+    difficulties=("hunt_target", "hunt_target"),
+    size=10,
+    fleet=None,
+    budget_ms=None,
+    use_opening_book=True,
+    use_transposition_table=False,
+    search_workers=None,
+):
+    """
+    Joga uma partida IA x IA até o fim.
+
+    A semente da partida vem de game_seed(seed, game) e o jogo em si é o
+    de self_play.play_game. Quem começa alterna: p1 nas partidas pares, p2
+    nas ímpares.
+
+    Args:
+        game: Número da partida
+        seed: Semente da simulação
+        difficulties: Níveis de p1 e p2 (ver SystemPlayer.DIFFICULTIES)
+        size: Lado dos tabuleiros
+        fleet: Tamanhos dos navios (padrão: frota temática)
+        budget_ms: Prazo por jogada (padrão: o de cada nível)
+        use_opening_book: Usa o opening book nos níveis fortes
+        use_transposition_table: Usa a tabela de transposição do processo;
+            as jogadas passam a depender das partidas que o processo já
+            jogou, então a partida deixa de ser reproduzível pelo número
+        search_workers: Processos da busca Monte Carlo (0 = sem pool)
+
+    Returns:
+        Dicionário com o resultado da partida ("winner" é "p1", "p2" ou None
+        se ninguém terminou dentro do limite de tiros)
+
+    Raises:
+        ValueError: Se a frota não couber no tabuleiro
+    """
+    match_seed = game_seed(seed, game)
+    first = game % 2
+    started = time.perf_counter()
+    result = play_game(
+        difficulties,
+        match_seed,
+        size,
+        fleet,
+        first,
+        budget_ms,
+        use_opening_book,
+        use_transposition_table,
+        search_workers,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    winner = result["winner"]
+    latencies = result["latencies"]
+    return {
+        "game": game,
+        "seed": match_seed,
+        "first": SIDES[first],
+        "winner": SIDES[winner] if winner is not None else None,
+        "turns": result["turns"],
+        "shots": result["shots"],
+        "hits": result["hits"],
+        "moves": [len(side) for side in latencies],
+        "latency_ms": [sum(side) for side in latencies],
+        "max_latency_ms": [max(side, default=0.0) for side in latencies],
+        "elapsed_ms": elapsed_ms,
+    }
+
+
+class SimulationStats:
+    """Agrega os resultados de partidas em contadores (memória constante)"""
+
+    __slots__ = (
+        "_games",
+        "_wins",
+        "_draws",
+        "_turns",
+        "_winning_shots",
+        "_shots",
+        "_hits",
+        "_latency",
+    )
+
+    def __init__(self):
+        self._games = 0
+        self._wins = [0, 0]
+        self._draws = 0
+        self._turns = 0
+        self._winning_shots = [0, 0]
+        self._shots = [0, 0]
+        self._hits = [0, 0]
+        self._latency = (LatencyStats(), LatencyStats())
+
+    @property
+    def games(self) -> int:
+        return self._games
+
+    def add(self, record):
+        """Soma o resultado de uma partida (dicionário de play_match)"""
+        self._games += 1
+        self._turns += record["turns"]
+        if record["winner"] is None:
+            self._draws += 1
+        else:
+            side = SIDES.index(record["winner"])
+            self._wins[side] += 1
+            self._winning_shots[side] += record["shots"][side]
+        for side in range(2):
+            self._shots[side] += record["shots"][side]
+            self._hits[side] += record["hits"][side]
+            self._latency[side].add_totals(
+                record["moves"][side],
+                record["latency_ms"][side],
+                record["max_latency_ms"][side],
+            )
+
+    def summary(self):
+        """Estatísticas agregadas por lado"""
+        games = self._games
+        sides = {}
+        for side, name in enumerate(SIDES):
+            wins = self._wins[side]
+            latency = self._latency[side]
+            sides[name] = {
+                "wins": wins,
+                "win_rate": wins / games if games else 0.0,
+                "mean_shots_to_win": (
+                    self._winning_shots[side] / wins if wins else None
+                ),
+                "hit_rate": (
+                    self._hits[side] / self._shots[side] if self._shots[side] else 0.0
+                ),
+                "mean_latency_ms": latency.mean_ms,
+                "max_latency_ms": latency.max_ms,
+            }
+        return {
+            "games": games,
+            "draws": self._draws,
+            "mean_turns": self._turns / games if games else 0.0,
+            "sides": sides,
+        }
+
+
+def format_summary(summary, difficulties):
+    """Resumo da simulação como texto"""
+    lines = [
+        f"{'lado':<6}{'nível':<14}{'vitórias':>10}{'tiros/vitória':>15}"
+        f"{'acertos':>10}{'média ms':>10}{'máx ms':>10}"
+    ]
+    for name, difficulty in zip(SIDES, difficulties):
+        entry = summary["sides"][name]
+        shots = entry["mean_shots_to_win"]
+        lines.append(
+            f"{name:<6}{difficulty:<14}{entry['win_rate']:>10.1%}"
+            f"{shots if shots is not None else float('nan'):>15.2f}"
+            f"{entry['hit_rate']:>10.1%}{entry['mean_latency_ms']:>10.3f}"
+            f"{entry['max_latency_ms']:>10.3f}"
+        )
+    lines.append("")
+    lines.append(
+        f"{summary['games']} partidas ({summary['draws']} sem vencedor), "
+        f"{summary['mean_turns']:.1f} turnos em média"
+    )
+    lines.append(
+        f"Tempo total: {summary['elapsed_s']:.2f}s "
+        f"({summary['games_per_s']:.1f} partidas/s)"
+    )
+    return "\n".join(lines)
+
+
+def build_parser():
+    """Argumentos comuns das simulações"""
+    parser = argparse.ArgumentParser(
+        prog="python -m simulation", description="Partidas IA x IA sem interface"
+    )
+    parser.add_argument("--games", type=int, default=100, help="Número de partidas")
+    parser.add_argument("--size", type=int, default=10, help="Lado dos tabuleiros")
+    parser.add_argument(
+        "--fleet", default=None, help="Tamanhos dos navios, ex.: 4,3,3,3,2"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--p1", default="hunt_target", choices=SystemPlayer.DIFFICULTIES
+    )
+    parser.add_argument(
+        "--p2", default="hunt_target", choices=SystemPlayer.DIFFICULTIES
+    )
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument(
+        "--no-book", action="store_true", help="Desliga o opening book"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Liga a tabela de transposição (partidas deixam de ser reproduzíveis)",
+    )
+    return parser
+
+
+def simulation_options(args, parser):
+    """Opções de play_match a partir dos argumentos da linha de comando"""
+    try:
+        fleet = parse_fleet(args.fleet) if args.fleet else None
+    except ValueError as e:
+        parser.error(str(e))
+    if args.size < 1:
+        parser.error("--size deve ser positivo")
+    if fleet and max(fleet) > args.size:
+        parser.error("Navio maior que o tabuleiro")
+    return {
+        "difficulties": (args.p1, args.p2),
+        "size": args.size,
+        "fleet": fleet,
+        "budget_ms": args.budget_ms,
+        "use_opening_book": not args.no_book,
+        "use_transposition_table": args.cache,
+    }
+
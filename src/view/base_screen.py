@@ -59,6 +59,13 @@ class BaseScreen(ABC):
                 self._bg_index = (self._bg_index + 1) % len(self._bg_surfaces)
                 self._bg_last_switch = current_time
 
+    def close(self) -> None:
+        """Libera recursos da tela ao sair dela (opcional).
+
+        Chamado antes de trocar de tela ou fechar o jogo.
+        """
+        pass
+
     def handle_event(self, event: pygame.event.Event):
         """Trata eventos do pygame (opcional).
 
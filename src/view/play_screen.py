@@ -2,6 +2,7 @@ import pygame
 
 from controller.play_controller import PlayController
 from view.base_screen import BaseScreen
+from view.ship_sprites import ship_sprites
 
 
 class PlayScreen(BaseScreen):
@@ -308,11 +309,11 @@ class PlayScreen(BaseScreen):
                     x = offset_x + ship_col * self._cell_size
                     y = offset_y + ship_row * self._cell_size
 
-                    # Check if this position is hit
-                    is_hit = pos in ship.hits
+                    # Check if this segment is hit
+                    is_hit = ship.is_segment_hit(i)
 
                     # Get ship image for this segment (i is the correct index)
-                    img = ship.get_image(i, self._cell_size)
+                    img = ship_sprites.get_image(ship, i, self._cell_size)
                     if img and not is_hit:
                         self._screen.blit(img, (x, y))
 
@@ -414,6 +415,10 @@ class PlayScreen(BaseScreen):
         )
         self._screen.blit(enemy_text, (enemy_box.x + 15, enemy_box.y + 13))
 
+    def close(self):
+        """Cancela a jogada do computador em cálculo ao sair da tela"""
+        self._controller.close()
+
     def check_click(self, pos):
         """Processa clique do mouse"""
         # Se o jogo terminou, vai para tela de game over
@@ -433,9 +438,10 @@ class PlayScreen(BaseScreen):
 
         # Verifica clique no tabuleiro inimigo
         x, y = pos
+        board_px = self._computer.board.size * self._cell_size
         if (
-            self._enemy_offset_x <= x < self._enemy_offset_x + 10 * self._cell_size
-            and self._offset_y <= y < self._offset_y + 10 * self._cell_size
+            self._enemy_offset_x <= x < self._enemy_offset_x + board_px
+            and self._offset_y <= y < self._offset_y + board_px
         ):
             col = (x - self._enemy_offset_x) // self._cell_size
             row = (y - self._offset_y) // self._cell_size
@@ -505,6 +511,8 @@ class PlayScreen(BaseScreen):
             self._waiting_computer_time = (
                 pygame.time.get_ticks() + 1500
             )  # Atraso de 1.5s
+            # A IA calcula a jogada em segundo plano durante o atraso
+            self._controller.request_computer_attack()
 
     def update(self):
         """Atualiza estado do jogo (chamado no loop principal)"""
@@ -569,10 +577,12 @@ class PlayScreen(BaseScreen):
             self._process_computer_turn()
 
     def _process_computer_turn(self):
-        """Processa turno do computador usando controlador"""
-        result, ship_destroyed, game_over, message = (
-            self._controller.process_computer_attack()
-        )
+        """Aplica o turno do computador quando a jogada em segundo plano termina"""
+        outcome = self._controller.poll_computer_attack()
+        if outcome is None:
+            return  # Ainda calculando; tenta de novo no próximo frame
+
+        result, ship_destroyed, game_over, message = outcome
 
         # Toca som apropriado baseado no resultado
         if result == "hit" and self._hit_sound:
@@ -614,16 +624,7 @@ class PlayScreen(BaseScreen):
         ships_remaining = status["player_ships_remaining"]
 
         # Calcula precisão (acertos / total de ataques)
-        if won:
-            attacks = self._computer.board.attacks
-            board = self._computer.board
-        else:
-            attacks = self._player.board.attacks
-            board = self._player.board
-
-        total_attacks = len(attacks)
-        hits = sum(1 for pos in attacks if board.grid[pos[0]][pos[1]] == "X")
-        accuracy = hits / total_attacks if total_attacks > 0 else 0.0
+        accuracy = self._compute_accuracy(status, won)
 
         # Salva no ranking
         try:
@@ -639,6 +640,14 @@ class PlayScreen(BaseScreen):
         except Exception as e:
             print(f"Erro ao salvar ranking: {e}")
 
+    def _compute_accuracy(self, status, won):
+        """Calcula precisão do vencedor a partir dos contadores da partida"""
+        if won:
+            shots, hits = status["player_shots"], status["player_hits"]
+        else:
+            shots, hits = status["computer_shots"], status["computer_hits"]
+        return hits / shots if shots > 0 else 0.0
+
     def _get_game_over_data(self):
         """Obtém dados para tela de game over"""
         status = self._controller.get_game_status()
@@ -650,17 +659,8 @@ class PlayScreen(BaseScreen):
         # Conta quantos navios PRÓPRIOS sobreviveram
         ships_remaining = status["player_ships_remaining"]
 
-        if won:
-            attacks = self._computer.board.attacks
-            board = self._computer.board
-        else:
-            attacks = self._player.board.attacks
-            board = self._player.board
-
         # Calcula precisão
-        total_attacks = len(attacks)
-        hits = sum(1 for pos in attacks if board.grid[pos[0]][pos[1]] == "X")
-        accuracy = hits / total_attacks if total_attacks > 0 else 0.0
+        accuracy = self._compute_accuracy(status, won)
 
         # Calcula pontuação se ranking está habilitado
         score = None
@@ -1,14 +1,10 @@
 import pygame
 
 from model.entities.players.common_player import CommonPlayer
-from model.entities.ships import (
-    ArgylesVanShip,
-    ChristmasShip,
-    DemogorgonShip,
-    LaboratoryShip,
-    ScoopsAhoyShip,
-)
+from model.entities.ships import default_fleet
+from model.placement import placement_table
 from view.base_screen import BaseScreen
+from view.ship_sprites import ship_sprites
 
 
 class PrepareScreen(BaseScreen):
@@ -17,6 +13,7 @@ class PrepareScreen(BaseScreen):
     Controles:
     - Clique esquerdo na grade do jogador: tenta posicionar navio atual na célula clicada
     - Clique direito ou tecla 'r': alterna orientação (horizontal/vertical)
+    - Tecla 'v': mostra/esconde as células onde o navio atual pode ser solto
     - Botão 'Aleatorizar': posiciona navios automaticamente (usa CommonPlayer.colocar_navios)
     - Botão 'Iniciar': disponível quando todos os navios estão posicionados, retorna "play"
     - Botão 'Voltar': retorna "home"
@@ -35,16 +32,17 @@ class PrepareScreen(BaseScreen):
         self._player = CommonPlayer("Você")
 
         # ships to place - using themed ship classes
-        self._ships_to_place = [
-            DemogorgonShip(),  # 5 cells
-            ScoopsAhoyShip(),  # 4 cells
-            ChristmasShip(),  # 3 cells
-            ArgylesVanShip(),  # 3 cells
-            LaboratoryShip(),  # 2 cells
-        ]
+        self._ships_to_place = default_fleet()
         self._current_index = 0
         self._horizontal = True
 
+        # Legality mask of start cells for the current ship and orientation
+        # (bit row * size + col), rebuilt only when a ship is placed or rotated
+        self._legal_starts = None
+        self._valid_drops_surface = None
+        self._show_valid_drops = False
+        self._v_key_pressed = False
+
         # Track key state to avoid repeated toggles
         self._r_key_pressed = False
         self._last_toggle_time = 0
@@ -111,10 +109,19 @@ class PrepareScreen(BaseScreen):
         if pressed[pygame.K_r]:
             if not self._r_key_pressed:
                 self._horizontal = not self._horizontal
+                self._invalidate_legality()
                 self._r_key_pressed = True
         else:
             self._r_key_pressed = False
 
+        # Toggle the "valid drops" overlay
+        if pressed[pygame.K_v]:
+            if not self._v_key_pressed:
+                self._show_valid_drops = not self._show_valid_drops
+                self._v_key_pressed = True
+        else:
+            self._v_key_pressed = False
+
     def draw(self):
         # Draw animated background
         self.draw_background()
@@ -167,6 +174,13 @@ class PrepareScreen(BaseScreen):
         # Draw placed ships with their images
         self._draw_placed_ships()
 
+        # Valid drops overlay (pre-rendered with the legality mask)
+        if self._show_valid_drops and not self.all_ships_placed():
+            self._ensure_legality()
+            self._screen.blit(
+                self._valid_drops_surface, (self._offset_x, self._offset_y)
+            )
+
         # Preview current ship under mouse (and show validity)
         mx, my = pygame.mouse.get_pos()
         preview = None
@@ -250,8 +264,8 @@ class PrepareScreen(BaseScreen):
             self._screen.blit(text_surf, text_rect)
 
         # Instructions box
-        inst_box = pygame.Rect(self._width - 340, 500, 320, 120)
-        inst_surface = pygame.Surface((320, 120), pygame.SRCALPHA)
+        inst_box = pygame.Rect(self._width - 340, 500, 320, 142)
+        inst_surface = pygame.Surface((320, 142), pygame.SRCALPHA)
         inst_surface.fill((0, 0, 0, 200))
         self._screen.blit(inst_surface, (inst_box.x, inst_box.y))
         pygame.draw.rect(self._screen, (100, 150, 255), inst_box, 2, border_radius=8)
@@ -263,6 +277,7 @@ class PrepareScreen(BaseScreen):
             "  posicionar o navio",
             "- Tecla R: Rotacionar",
             "- Clique direito: Rotacionar",
+            "- Tecla V: Posicoes validas",
         ]
 
         y_offset = inst_box.y + 10
@@ -291,10 +306,44 @@ class PrepareScreen(BaseScreen):
                 y = self._offset_y + row * self._cell_size
 
                 # Get ship image for this segment (i is the correct index)
-                img = ship.get_image(i, self._cell_size)
+                img = ship_sprites.get_image(ship, i, self._cell_size)
                 if img:
                     self._screen.blit(img, (x, y))
 
+    def _invalidate_legality(self):
+        """Descarta a máscara de legalidade (navio posicionado ou rotacionado)"""
+        self._legal_starts = None
+        self._valid_drops_surface = None
+
+    def _ensure_legality(self):
+        """Calcula a máscara de células iniciais válidas do navio atual"""
+        if self._legal_starts is not None:
+            return
+        size = self._board_size
+        ship = self._ships_to_place[self._current_index]
+        table = placement_table(size, ship.size)
+        occupied = self._player.board.occupied_mask
+
+        legal = 0
+        for (row, col, horizontal), mask in zip(table.starts, table.masks):
+            if horizontal == self._horizontal and not mask & occupied:
+                legal |= 1 << (row * size + col)
+        self._legal_starts = legal
+
+        # Overlay de posições válidas, desenhado uma vez por máscara
+        board_px = size * self._cell_size
+        surface = pygame.Surface((board_px, board_px), pygame.SRCALPHA)
+        marker = self._cell_size // 3
+        for cell in range(size * size):
+            if legal >> cell & 1:
+                row, col = divmod(cell, size)
+                center = (
+                    col * self._cell_size + self._cell_size // 2,
+                    row * self._cell_size + self._cell_size // 2,
+                )
+                pygame.draw.circle(surface, (50, 255, 50, 110), center, marker // 2)
+        self._valid_drops_surface = surface
+
     def _compute_preview(self, mx, my):
         # if mouse over board, compute rectangle positions for preview
         if not (
@@ -309,30 +358,19 @@ class PrepareScreen(BaseScreen):
         col = (mx - self._offset_x) // self._cell_size
         row = (my - self._offset_y) // self._cell_size
         ship = self._ships_to_place[self._current_index]
-        rects = []
-        positions = []
-        for i in range(ship.size):
-            if self._horizontal:
-                r = row
-                c = col + i
-            else:
-                r = row + i
-                c = col
-            # compute top-left pixel
-            rx = self._offset_x + c * self._cell_size
-            ry = self._offset_y + r * self._cell_size
-            rects.append((rx, ry))
-            positions.append((r, c))
-
-        # validity check: ensure all positions are inside board and unoccupied
-        valid = True
-        for r, c in positions:
-            if r < 0 or c < 0 or r >= self._board_size or c >= self._board_size:
-                valid = False
-                break
-            if self._player.board.grid[r][c] != "~":
-                valid = False
-                break
+
+        # compute top-left pixel of each segment
+        if self._horizontal:
+            step_x, step_y = self._cell_size, 0
+        else:
+            step_x, step_y = 0, self._cell_size
+        x = self._offset_x + col * self._cell_size
+        y = self._offset_y + row * self._cell_size
+        rects = [(x + i * step_x, y + i * step_y) for i in range(ship.size)]
+
+        # validity check: lookup in the legality mask of start cells
+        self._ensure_legality()
+        valid = bool(self._legal_starts >> (row * self._board_size + col) & 1)
 
         return (rects, valid)
 
@@ -356,7 +394,9 @@ class PrepareScreen(BaseScreen):
 
                 if action == "randomize":
                     # reset and auto-place
-                    self._player.board = self._player.board.__class__()
+                    self._player.board = self._player.board.__class__(
+                        self._player.board.size
+                    )
                     self._player.place_ships()
 
                     # Play put sound for randomization
@@ -365,6 +405,7 @@ class PrepareScreen(BaseScreen):
 
                     # mark all as placed
                     self._current_index = len(self._ships_to_place)
+                    self._invalidate_legality()
                     self._message = "Navios posicionados aleatoriamente"
                     return None
 
@@ -404,6 +445,7 @@ class PrepareScreen(BaseScreen):
 
                 # Only increment if successfully added
                 self._current_index += 1
+                self._invalidate_legality()
                 if self._current_index >= len(self._ships_to_place):
                     self._message = "Todos os navios posicionados"
                 else:
@@ -424,6 +466,7 @@ class PrepareScreen(BaseScreen):
                 current_time = pygame.time.get_ticks()
                 if current_time - self._last_toggle_time > self._toggle_cooldown:
                     self._horizontal = not self._horizontal
+                    self._invalidate_legality()
                     self._last_toggle_time = current_time
                     orientation = "Horizontal" if self._horizontal else "Vertical"
                     self._message = f"Orientação: {orientation}"
@@ -0,0 +1,71 @@
+"""ShipSpriteRegistry - cache de imagens dos segmentos de navio por processo"""
+
+import pygame
+
+
+class ShipSpriteRegistry:
+    """Registro preguiçoso de sprites de navio.
+
+    Cada segmento é decodificado do disco uma única vez por processo, indexado
+    pelo tipo do navio (seu image_path) e pelo índice do segmento. As versões
+    redimensionadas e rotacionadas também ficam em cache, de modo que desenhar
+    um navio a cada frame não faz nenhuma transformação.
+    """
+
+    def __init__(self):
+        self._segments = {}  # (image_path, segmento) -> superfície decodificada
+        self._scaled = {}  # (image_path, segmento, cell_size, horizontal) -> superfície
+
+    def get_image(self, ship, segment_index, cell_size=40):
+        """Obtém imagem redimensionada para um segmento do navio, rotacionada se vertical"""
+        if not ship.image_path or segment_index >= ship.size:
+            return None
+
+        key = (ship.image_path, segment_index, cell_size, ship.horizontal)
+        img = self._scaled.get(key)
+        if img is None:
+            img = self._get_segment(ship, segment_index)
+            img = pygame.transform.scale(img, (cell_size, cell_size))
+
+            # Rotaciona -90 graus (270 graus) se o navio estiver vertical
+            if not ship.horizontal:
+                img = pygame.transform.rotate(img, -90)
+
+            self._scaled[key] = img
+        return img
+
+    def _get_segment(self, ship, segment_index):
+        """Obtém a superfície original do segmento, decodificando na primeira vez"""
+        key = (ship.image_path, segment_index)
+        img = self._segments.get(key)
+        if img is None:
+            img = self._load_segment(ship, segment_index)
+            self._segments[key] = img
+        return img
+
+    def _load_segment(self, ship, segment_index):
+        """Carrega imagem de um segmento do navio"""
+        segment_path = f"{ship.image_path}_segment_{segment_index + 1}.jpg"
+        try:
+            return pygame.image.load(segment_path)
+        except Exception:
+            # Tenta imagem base
+            try:
+                return pygame.image.load(f"{ship.image_path}.jpg")
+            except Exception:
+                # Cria retângulo colorido como placeholder
+                surf = pygame.Surface((40, 40))
+                surf.fill((100, 100, 100))
+                print(
+                    f"Aviso: Não foi possível carregar segmento {segment_index + 1} para {ship.name}"
+                )
+                return surf
+
+    def clear(self):
+        """Descarta todas as superfícies em cache"""
+        self._segments.clear()
+        self._scaled.clear()
+
+
+# Registro compartilhado por todas as telas do processo
+ship_sprites = ShipSpriteRegistry()
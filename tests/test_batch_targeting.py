@@ -0,0 +1,52 @@
+"""Testes de BatchTargeting com partidas já terminadas no lote
+
+Rodar a partir da raiz do projeto:
+    PYTHONPATH=src python -m unittest discover tests
+"""
+
+import unittest
+
+from model.ai.batch_targeting import BatchTargeting, np
+from model.entities.board import HIT, WATER
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BatchTargetingFinishedBoardTest(unittest.TestCase):
+    def setUp(self):
+        self.size = 3
+        self.targeting = BatchTargeting(2, self.size, "hunt_target", seed=1)
+        # Partida 1 terminada: todas as células atacadas
+        self.targeting.attacked[1] = True
+
+    def test_finished_board_has_no_attack(self):
+        rows, cols = self.targeting.next_attacks()
+        self.assertEqual((rows[1], cols[1]), (-1, -1))
+        self.assertGreaterEqual(rows[0], 0)
+
+    def test_finished_board_result_is_ignored(self):
+        rows, cols = self.targeting.next_attacks()
+        before = self.targeting.attacked.copy()
+
+        # O código da partida terminada é lixo e não pode ser registrado
+        self.targeting.record_attack_results(
+            rows, cols, [WATER, HIT], [False, False]
+        )
+
+        expected = before
+        expected[0, rows[0] * self.size + cols[0]] = True
+        np.testing.assert_array_equal(self.targeting.attacked, expected)
+        self.assertFalse(self.targeting.search_mode[1])
+
+    def test_negative_attack_does_not_wrap_around(self):
+        targeting = BatchTargeting(2, self.size, "hunt_target", seed=1)
+
+        targeting.record_attack_results([0, -1], [1, -1], [WATER, HIT], [False, False])
+
+        self.assertEqual(targeting.attacked[0].sum(), 1)
+        self.assertTrue(targeting.attacked[0, 1])
+        self.assertFalse(targeting.attacked[1].any())
+        self.assertFalse(targeting.search_mode[1])
+
+
+if __name__ == "__main__":
+    unittest.main()